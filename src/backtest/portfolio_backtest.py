@@ -7,8 +7,8 @@
 import pandas as pd
 import numpy as np
 import yfinance as yf
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 
@@ -68,6 +68,11 @@ class BacktestResult:
     total_tax: float
     total_transaction_cost: float
 
+    # 히스토리/연간 요약 DataFrame 캐시 (재렌더링 시 재계산 방지)
+    _frames: Dict[str, pd.DataFrame] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
 
 class PortfolioBacktester:
     """포트폴리오 백테스터
@@ -88,7 +93,9 @@ class PortfolioBacktester:
         etf_info: Dict[str, ETFInfo] = None,
         currency_converter: CurrencyConverter = None,
         kr_dividend_tax_rate: float = None,
-        kr_capital_gains_rate: float = None
+        kr_capital_gains_rate: float = None,
+        price_data: Dict[str, pd.DataFrame] = None,
+        dividend_data: Dict[str, pd.Series] = None
     ):
         """
         Args:
@@ -104,6 +111,8 @@ class PortfolioBacktester:
             currency_converter: 환율 변환기 (혼합 통화 포트폴리오용)
             kr_dividend_tax_rate: 국내 ETF 배당소득세율 (기본 15.4%)
             kr_capital_gains_rate: 국내 기타 ETF 매매차익 세율 (기본 15.4%)
+            price_data: 미리 로드된 종목별 가격 데이터 (있는 종목은 조회 생략)
+            dividend_data: 미리 로드된 종목별 배당금 데이터 (있는 종목은 조회 생략)
         """
         self.initial_capital = initial_capital
         self.allocation = allocation or {'SPY': 0.60, 'QQQ': 0.30, 'BIL': 0.10}
@@ -122,9 +131,11 @@ class PortfolioBacktester:
             kr_capital_gains_rate=kr_capital_gains_rate
         )
         
-        # 데이터 캐시
-        self._price_data: Dict[str, pd.DataFrame] = {}
-        self._dividend_data: Dict[str, pd.DataFrame] = {}
+        # 데이터 캐시 (여러 백테스트가 같은 데이터를 공유할 수 있도록 외부 주입 허용)
+        self._price_data: Dict[str, pd.DataFrame] = dict(price_data or {})
+        self._dividend_data: Dict[str, pd.DataFrame] = dict(dividend_data or {})
+        # 가격 조회용 (원본 DataFrame, 날짜 배열, 종가 배열) 캐시
+        self._price_arrays: Dict[str, Tuple[pd.DataFrame, np.ndarray, np.ndarray]] = {}
         
         # 포트폴리오 상태
         self.holdings: Dict[str, float] = {}  # 종목별 보유 수량
@@ -147,8 +158,11 @@ class PortfolioBacktester:
         for symbol in symbols:
             logger.info(f"{symbol} 데이터 수집 중...")
 
-            self._price_data[symbol] = fetch_price_data(symbol, start_str, end_str)
-            self._dividend_data[symbol] = fetch_dividend_data(symbol, start_str, end_str)
+            # 미리 로드된 종목은 재조회하지 않음
+            if symbol not in self._price_data:
+                self._price_data[symbol] = fetch_price_data(symbol, start_str, end_str)
+            if symbol not in self._dividend_data:
+                self._dividend_data[symbol] = fetch_dividend_data(symbol, start_str, end_str)
 
             logger.info(f"{symbol}: {len(self._price_data[symbol])} 거래일, {len(self._dividend_data[symbol])} 배당 이벤트")
 
@@ -157,24 +171,36 @@ class PortfolioBacktester:
             logger.info("혼합 통화 포트폴리오 감지 → 환율 데이터 조회 중...")
             self.currency_converter.fetch_fx_data(start_str, end_str)
     
+    def _get_price_arrays(self, symbol: str) -> Tuple[np.ndarray, np.ndarray]:
+        """종목별 (날짜, 종가) 배열 반환 (가격 DataFrame이 바뀌면 다시 생성)"""
+        df = self._price_data[symbol]
+        cached = self._price_arrays.get(symbol)
+        if cached is None or cached[0] is not df:
+            sorted_df = df if df.index.is_monotonic_increasing else df.sort_index()
+            cached = (
+                df,
+                sorted_df.index.values.astype('datetime64[ns]'),
+                sorted_df['price'].to_numpy(dtype=np.float64)
+            )
+            self._price_arrays[symbol] = cached
+        return cached[1], cached[2]
+
     def _get_price(self, symbol: str, date: pd.Timestamp) -> Optional[float]:
         """특정 날짜의 가격 조회 (없으면 직후 거래일 종가 우선, 그다음 직전)"""
         if symbol not in self._price_data:
             return None
-        
-        df = self._price_data[symbol]
-        
-        # 직후(해당일 포함) 첫 거래일 종가를 우선 사용
-        future_mask = df.index >= date
-        if future_mask.any():
-            return df.loc[future_mask, 'price'].iloc[0]
-        
-        # 미래에 없으면 직전 거래일 종가 사용
-        past_mask = df.index <= date
-        if past_mask.any():
-            return df.loc[past_mask, 'price'].iloc[-1]
-        
-        return None
+
+        dates, prices = self._get_price_arrays(symbol)
+        if len(dates) == 0:
+            return None
+
+        # 직후(해당일 포함) 첫 거래일 종가를 우선 사용 (이진 탐색)
+        pos = np.searchsorted(dates, pd.Timestamp(date).to_datetime64(), side='left')
+        if pos < len(dates):
+            return prices[pos]
+
+        # 미래에 없으면 직전(마지막) 거래일 종가 사용
+        return prices[-1]
     
     def _get_dividends(self, symbol: str, start_date: pd.Timestamp, end_date: pd.Timestamp) -> pd.Series:
         """기간 내 배당금 조회"""
@@ -840,7 +866,19 @@ class PortfolioBacktester:
         return cumulative_withdrawal, cumulative_dividend, cumulative_tax, prev_year
     
     def get_portfolio_history_df(self, result: BacktestResult) -> pd.DataFrame:
-        """포트폴리오 히스토리 DataFrame 반환"""
+        """포트폴리오 히스토리 DataFrame 반환 (결과 객체에 캐시, 사본 반환)"""
+        if 'history' not in result._frames:
+            result._frames['history'] = self._build_history_df(result)
+        return result._frames['history'].copy()
+
+    def get_annual_summary_df(self, result: BacktestResult) -> pd.DataFrame:
+        """연간 요약 DataFrame 반환 (결과 객체에 캐시, 사본 반환)"""
+        if 'annual' not in result._frames:
+            result._frames['annual'] = self._build_annual_summary_df(result)
+        return result._frames['annual'].copy()
+
+    def _build_history_df(self, result: BacktestResult) -> pd.DataFrame:
+        """포트폴리오 히스토리 DataFrame 생성"""
         records = []
         for snapshot in result.portfolio_history:
             record = {
@@ -861,8 +899,8 @@ class PortfolioBacktester:
         
         return pd.DataFrame(records)
     
-    def get_annual_summary_df(self, result: BacktestResult) -> pd.DataFrame:
-        """연간 요약 DataFrame 반환"""
+    def _build_annual_summary_df(self, result: BacktestResult) -> pd.DataFrame:
+        """연간 요약 DataFrame 생성"""
         history_df = self.get_portfolio_history_df(result)
         history_df['year'] = history_df['date'].dt.year
 
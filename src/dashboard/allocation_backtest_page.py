@@ -6,6 +6,7 @@ ETF 포트폴리오의 자산 배분 전략을 백테스팅합니다.
 """
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -106,14 +107,16 @@ def _etf_currency_label(symbol: str) -> str:
     return "KRW" if is_korean_ticker(symbol) else "USD"
 
 
-def display_etf_performance(backtester: 'PortfolioBacktester'):
+def display_etf_performance(backtester: 'PortfolioBacktester', symbols: list = None):
     """
     구성 종목별 성과 표시 (주가 차트 + 배당금 차트 + 배당수익률 테이블)
 
     Args:
         backtester: PortfolioBacktester instance with _price_data and _dividend_data
+        symbols: 표시할 종목 리스트 (없으면 backtester.allocation 순서 사용)
     """
-    symbols = list(backtester.allocation.keys())
+    if symbols is None:
+        symbols = list(backtester.allocation.keys())
     price_data = backtester._price_data
     dividend_data = backtester._dividend_data
 
@@ -528,26 +531,29 @@ def _render_portfolio_chart(history_df: pd.DataFrame, result: BacktestResult, ba
     st.plotly_chart(fig, use_container_width=True)
 
 
-def _render_allocation_chart(history_df: pd.DataFrame, base_currency: str):
+def _render_allocation_chart(history_df: pd.DataFrame, symbols: list, base_currency: str):
     """자산별 비중 변화 (Stacked Area) 차트 렌더링"""
 
     lbl = _currency_label(base_currency)
 
     st.subheader("자산별 비중 변화")
 
-    # 자산별 가치 컬럼 찾기 (total 제외)
-    value_cols = [col for col in history_df.columns if col.endswith('_value') and col != 'total_value']
-    symbols = [col.replace('_value', '') for col in value_cols]
+    # 자산별 가치 컬럼 (보유 이력이 있는 종목만)
+    symbols = [symbol for symbol in symbols if f'{symbol}_value' in history_df.columns]
 
-    if value_cols:
+    if symbols:
         fig = go.Figure()
 
         colors = px.colors.qualitative.Set2
 
-        for i, (symbol, col) in enumerate(zip(symbols, value_cols)):
+        # 날짜/종목별 가치를 한 번에 numpy로 변환 후 컬럼 슬라이스만 전달
+        dates = history_df['date'].to_numpy()
+        values = history_df[[f'{symbol}_value' for symbol in symbols]].to_numpy()
+
+        for i, symbol in enumerate(symbols):
             fig.add_trace(go.Scatter(
-                x=history_df['date'],
-                y=history_df[col],
+                x=dates,
+                y=values[:, i],
                 mode='lines',
                 name=symbol,
                 stackgroup='one',
@@ -621,6 +627,31 @@ def _render_annual_summary(annual_df: pd.DataFrame, base_currency: str):
         st.dataframe(display_df, use_container_width=True, hide_index=True)
 
 
+def _aggregate_monthly_dividends(dividend_events: list) -> pd.DataFrame:
+    """배당 이벤트를 월별로 합산
+
+    정렬된 월 키에 np.unique + np.add.reduceat을 적용하여
+    pandas groupby/PeriodIndex 생성 비용 없이 집계합니다.
+
+    Returns:
+        DataFrame with columns [date, gross_dividend, net_dividend, tax]
+    """
+    months = np.array([e['date'] for e in dividend_events], dtype='datetime64[M]')
+    gross = np.fromiter((e['gross_dividend'] for e in dividend_events), dtype=float, count=len(dividend_events))
+    net = np.fromiter((e['net_dividend'] for e in dividend_events), dtype=float, count=len(dividend_events))
+    tax = np.fromiter((e['tax'] for e in dividend_events), dtype=float, count=len(dividend_events))
+
+    order = np.argsort(months, kind='stable')
+    unique_months, start_idx = np.unique(months[order], return_index=True)
+
+    return pd.DataFrame({
+        'date': unique_months.astype('datetime64[ns]'),
+        'gross_dividend': np.add.reduceat(gross[order], start_idx),
+        'net_dividend': np.add.reduceat(net[order], start_idx),
+        'tax': np.add.reduceat(tax[order], start_idx)
+    })
+
+
 def _render_withdrawal_dividend(result: BacktestResult, base_currency: str):
     """인출금 vs 배당금 비교 차트 렌더링"""
 
@@ -660,13 +691,7 @@ def _render_withdrawal_dividend(result: BacktestResult, base_currency: str):
 
     with col2:
         if result.dividend_events:
-            div_df = pd.DataFrame(result.dividend_events)
-            div_monthly = div_df.groupby(div_df['date'].dt.to_period('M')).agg({
-                'gross_dividend': 'sum',
-                'net_dividend': 'sum',
-                'tax': 'sum'
-            }).reset_index()
-            div_monthly['date'] = div_monthly['date'].dt.to_timestamp()
+            div_monthly = _aggregate_monthly_dividends(result.dividend_events)
 
             fig = go.Figure()
             fig.add_trace(go.Bar(
@@ -722,8 +747,9 @@ def _render_tax_summary(result: BacktestResult, base_currency: str):
     with cols[-1]:
         st.metric("총 세금", f"{sym}{result.total_tax:,.0f}")
 
-    # 세금 비율 파이 차트
-    if result.total_tax > 0:
+    # 세금 비율 파이 차트 (세금 유형이 2개 이상일 때만 - 단일 유형은 위 메트릭으로 충분)
+    num_tax_types = sum(tax > 0 for tax in (dividend_tax, capital_gains_tax, kr_capital_gains_tax))
+    if num_tax_types >= 2:
         labels = ['배당소득세', '양도소득세']
         values = [dividend_tax, capital_gains_tax]
         colors = ['#ff7f0e', '#d62728']
@@ -815,6 +841,8 @@ def _render_detail_logs(result: BacktestResult, base_currency: str):
 def display_backtest_results(result: BacktestResult, backtester: PortfolioBacktester, base_currency: str = "USD"):
     """백테스트 결과 표시"""
 
+    symbols = list(backtester.allocation.keys())
+
     st.markdown("---")
     st.subheader("백테스트 결과")
 
@@ -824,10 +852,10 @@ def display_backtest_results(result: BacktestResult, backtester: PortfolioBackte
     history_df = backtester.get_portfolio_history_df(result)
 
     _render_portfolio_chart(history_df, result, base_currency)
-    _render_allocation_chart(history_df, base_currency)
+    _render_allocation_chart(history_df, symbols, base_currency)
 
     st.subheader("구성 종목별 성과")
-    display_etf_performance(backtester)
+    display_etf_performance(backtester, symbols)
 
     _render_annual_summary(backtester.get_annual_summary_df(result), base_currency)
     _render_withdrawal_dividend(result, base_currency)
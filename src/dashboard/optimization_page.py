@@ -9,14 +9,15 @@ Mean-Variance Optimization을 통한 최적 자산 배분 계산
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
 import logging
 
 from src.optimizer.portfolio_optimizer import PortfolioOptimizer
 from src.backtest.portfolio_backtest import PortfolioBacktester
-from src.dashboard.sidebar_utils import render_common_sidebar
-from src.data.etf_classifier import classify_portfolio, needs_currency_conversion
+from src.dashboard.sidebar_utils import BacktestSettings, render_common_sidebar
+from src.data.etf_classifier import (
+    classify_portfolio, needs_currency_conversion, normalize_ticker, is_valid_ticker
+)
 from src.data.fx_fetcher import CurrencyConverter
 from config.settings import ETF_BACKTEST_DEFAULTS, BACKTEST_CONSTANTS
 
@@ -46,6 +47,93 @@ PRESET_PORTFOLIOS = {
 }
 
 
+@st.cache_resource(ttl=3600, max_entries=32, show_spinner=False)
+def _get_optimizer(
+    tickers: tuple,
+    period_years: int,
+    risk_free_rate: float
+) -> PortfolioOptimizer:
+    """
+    데이터 조회가 끝난 옵티마이저 반환 (세션 간 공유 리소스로 캐싱)
+
+    기대수익률/공분산/분해 인자는 fetch_data()에서 모두 계산되므로
+    이후 최적화 호출은 옵티마이저 상태를 읽기만 합니다.
+
+    Args:
+        tickers: ETF 심볼 튜플 (cache key용 immutable)
+        period_years: 분석 기간 (년)
+        risk_free_rate: 무위험수익률
+    """
+    optimizer = PortfolioOptimizer(
+        tickers=list(tickers),
+        period_years=period_years,
+        risk_free_rate=risk_free_rate
+    )
+    optimizer.fetch_data()
+    return optimizer
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _compute_frontier(
+    tickers: tuple,
+    period_years: int,
+    risk_free_rate: float
+) -> tuple:
+    """
+    Efficient Frontier와 개별 자산 정보 계산 (캐싱, 알고리즘과 무관)
+
+    Returns:
+        (ef_vol, ef_ret, individual_assets) 튜플
+        - individual_assets: 개별 자산 (tickers, volatilities, expected_returns) 배열 튜플
+    """
+    optimizer = _get_optimizer(tickers, period_years, risk_free_rate)
+
+    ef_vol, ef_ret, _ = optimizer.get_efficient_frontier(n_points=50)
+
+    # 개별 자산 정보 (차트에 바로 넘길 수 있도록 배열로 한 번만 변환)
+    assets_df = optimizer.get_individual_assets()
+    individual_assets = (
+        assets_df['ticker'].to_numpy(dtype=str),
+        assets_df['volatility'].to_numpy(dtype=float),
+        assets_df['expected_return'].to_numpy(dtype=float)
+    )
+    return ef_vol, ef_ret, individual_assets
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _run_optimization(
+    tickers: tuple,
+    period_years: int,
+    algorithm: str,
+    risk_free_rate: float
+) -> tuple:
+    """
+    최적화 파이프라인 실행 (캐싱)
+
+    동일한 (tickers, period_years, algorithm, risk_free_rate) 조합으로
+    재실행하면 데이터 조회와 최적화/Efficient Frontier 계산을 생략합니다.
+    알고리즘만 바꾸면 옵티마이저와 Efficient Frontier는 캐시를 재사용합니다.
+
+    Args:
+        tickers: ETF 심볼 튜플 (cache key용 immutable)
+        period_years: 분석 기간 (년)
+        algorithm: 'max_sharpe' 또는 'min_volatility'
+        risk_free_rate: 무위험수익률
+
+    Returns:
+        (optimal_weights, metrics, ef_vol, ef_ret, individual_assets) 튜플
+        - individual_assets: 개별 자산 (tickers, volatilities, expected_returns) 배열 튜플
+    """
+    optimizer = _get_optimizer(tickers, period_years, risk_free_rate)
+
+    # 최적화 수행 및 성과 지표 계산
+    optimal_weights, metrics = optimizer.optimize(algorithm)
+
+    ef_vol, ef_ret, individual_assets = _compute_frontier(tickers, period_years, risk_free_rate)
+
+    return optimal_weights, metrics, ef_vol, ef_ret, individual_assets
+
+
 def show_optimization_page():
     """최적 포트폴리오 배분 페이지"""
 
@@ -74,8 +162,17 @@ def show_optimization_page():
             help="2~10개의 ETF 티커를 입력하세요"
         )
 
-        # 티커 파싱
-        tickers = [t.strip().upper() for t in tickers_input.split(",") if t.strip()]
+        # 티커 파싱: 정규화 → 형식 검증 → 순서 유지 중복 제거
+        parsed = [normalize_ticker(t) for t in tickers_input.split(",") if t.strip()]
+
+        invalid = [t for t in parsed if not is_valid_ticker(t)]
+        if invalid:
+            st.error(f"올바르지 않은 티커 형식입니다: {', '.join(invalid)}")
+            return
+
+        tickers = list(dict.fromkeys(parsed))
+        if len(tickers) < len(parsed):
+            st.warning("중복된 티커를 제거했습니다.")
 
         if len(tickers) < 2:
             st.error("최소 2개 이상의 티커를 입력하세요.")
@@ -120,29 +217,13 @@ def show_optimization_page():
     if optimize_btn:
         try:
             with st.spinner("데이터 로딩 및 최적화 중..."):
-                optimizer = PortfolioOptimizer(
-                    tickers=tickers,
-                    period_years=period_years,
-                    risk_free_rate=BACKTEST_CONSTANTS['risk_free_rate']
+                optimal_weights, metrics, ef_vol, ef_ret, individual_assets = _run_optimization(
+                    tuple(tickers),
+                    period_years,
+                    algorithm,
+                    BACKTEST_CONSTANTS['risk_free_rate']
                 )
-                optimizer.fetch_data()
-
-                # 최적화 수행
-                if algorithm == "max_sharpe":
-                    optimal_weights = optimizer.optimize_max_sharpe()
-                    algo_name = "Max Sharpe Ratio"
-                else:
-                    optimal_weights = optimizer.optimize_min_volatility()
-                    algo_name = "Min Volatility"
-
-                # 성과 지표 계산
-                metrics = optimizer.get_performance_metrics(optimal_weights)
-
-                # Efficient Frontier 계산
-                ef_vol, ef_ret, ef_weights = optimizer.get_efficient_frontier(n_points=50)
-
-                # 개별 자산 정보
-                individual_assets = optimizer.get_individual_assets()
+                algo_name = "Max Sharpe Ratio" if algorithm == "max_sharpe" else "Min Volatility"
 
             # 결과를 세션 상태에 저장
             st.session_state['opt_weights'] = optimal_weights
@@ -201,58 +282,69 @@ def _display_optimal_allocation(weights: dict, algo_name: str):
     """최적 배분 결과 표시"""
     st.subheader(f"최적 자산 배분 ({algo_name})")
 
+    # 0.1% 이상 비중만 내림차순으로 한 번에 정리 (파이 차트/테이블 공용)
+    s = pd.Series(weights, name='비중', dtype=float)
+    s = s[s > 0.001].sort_values(ascending=False, kind='stable')
+
     col1, col2 = st.columns([1, 1])
 
     with col1:
         # 파이 차트
-        df = pd.DataFrame([
-            {'ETF': ticker, '비중': weight}
-            for ticker, weight in weights.items()
-            if weight > 0.001  # 0.1% 이상만 표시
-        ])
-
-        if not df.empty:
-            fig = px.pie(
-                df,
-                values='비중',
-                names='ETF',
-                title='최적 포트폴리오 구성',
-                hole=0.4
-            )
-            fig.update_traces(textinfo='label+percent', textposition='outside')
-            fig.update_layout(height=400, showlegend=True)
+        if not s.empty:
+            fig = go.Figure(go.Pie(
+                labels=s.index.tolist(),
+                values=s.to_numpy(),
+                hole=0.4,
+                textinfo='label+percent',
+                textposition='outside'
+            ))
+            fig.update_layout(title='최적 포트폴리오 구성', height=400, showlegend=True)
             st.plotly_chart(fig, use_container_width=True)
 
     with col2:
         # 비중 테이블
         st.markdown("**배분 비율**")
 
-        table_data = []
-        for ticker, weight in sorted(weights.items(), key=lambda x: -x[1]):
-            if weight > 0.001:
-                table_data.append({
-                    'ETF': ticker,
-                    '비중 (%)': f"{weight * 100:.1f}%"
-                })
+        table_df = (
+            s.mul(100).map('{:.1f}%'.format)
+            .rename('비중 (%)')
+            .rename_axis('ETF')
+            .reset_index()
+        )
 
         st.dataframe(
-            pd.DataFrame(table_data),
+            table_df,
             hide_index=True,
             use_container_width=True
         )
 
 
-def _display_efficient_frontier(
+@st.cache_data(ttl=3600, show_spinner=False)
+def _build_ef_figure(
     ef_vol: np.ndarray,
     ef_ret: np.ndarray,
     opt_vol: float,
     opt_ret: float,
-    individual_assets: pd.DataFrame,
+    asset_tickers: np.ndarray,
+    asset_vols: np.ndarray,
+    asset_rets: np.ndarray,
     algo_name: str
-):
-    """Efficient Frontier 시각화"""
-    st.subheader("Efficient Frontier")
-
+) -> go.Figure:
+    """
+    Efficient Frontier 차트 생성 (캐싱)
+
+    위젯 조작으로 페이지가 재실행되어도 동일한 결과는 Figure를 다시 만들지 않습니다.
+
+    Args:
+        ef_vol: frontier 변동성 배열
+        ef_ret: frontier 수익률 배열
+        opt_vol: 최적 포트폴리오 변동성
+        opt_ret: 최적 포트폴리오 기대수익률
+        asset_tickers: 개별 자산 티커 배열
+        asset_vols: 개별 자산 변동성 배열
+        asset_rets: 개별 자산 기대수익률 배열
+        algo_name: 알고리즘 표시명
+    """
     fig = go.Figure()
 
     # Efficient Frontier 곡선
@@ -275,12 +367,12 @@ def _display_efficient_frontier(
 
     # 개별 자산 포인트
     fig.add_trace(go.Scatter(
-        x=individual_assets['volatility'] * 100,
-        y=individual_assets['expected_return'] * 100,
+        x=asset_vols * 100,
+        y=asset_rets * 100,
         mode='markers+text',
         name='개별 자산',
         marker=dict(color='green', size=10),
-        text=individual_assets['ticker'],
+        text=asset_tickers,
         textposition='top center'
     ))
 
@@ -292,6 +384,26 @@ def _display_efficient_frontier(
         showlegend=True,
         hovermode='closest'
     )
+    return fig
+
+
+def _display_efficient_frontier(
+    ef_vol: np.ndarray,
+    ef_ret: np.ndarray,
+    opt_vol: float,
+    opt_ret: float,
+    individual_assets: tuple,
+    algo_name: str
+):
+    """
+    Efficient Frontier 시각화
+
+    Args:
+        individual_assets: 개별 자산 (tickers, volatilities, expected_returns) 배열 튜플
+    """
+    st.subheader("Efficient Frontier")
+
+    fig = _build_ef_figure(ef_vol, ef_ret, opt_vol, opt_ret, *individual_assets, algo_name)
 
     st.plotly_chart(fig, use_container_width=True)
 
@@ -336,8 +448,59 @@ def _display_performance_metrics(metrics: dict, algo_name: str):
     )
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _run_backtest(allocation_items: tuple, settings: BacktestSettings) -> tuple:
+    """
+    최적 배분 백테스트 실행 (캐싱)
+
+    동일한 배분과 설정으로 다시 실행하면 시뮬레이션을 생략합니다.
+
+    Args:
+        allocation_items: (티커, 비중) 튜플의 튜플 (최적화 결과 순서 유지, cache key용 immutable)
+        settings: 공통 백테스트 설정
+
+    Returns:
+        (result, history_df, annual_df) 튜플
+    """
+    allocation = dict(allocation_items)
+
+    # ETF 분류 및 환율 변환기 생성
+    etf_info = classify_portfolio(allocation)
+    converter = None
+    if needs_currency_conversion(etf_info, settings.base_currency):
+        converter = CurrencyConverter(base_currency=settings.base_currency)
+
+    backtester = PortfolioBacktester(
+        initial_capital=settings.initial_capital,
+        allocation=allocation,
+        rebalance_frequency=settings.rebalance_freq,
+        withdrawal_rate=settings.withdrawal_rate,
+        dividend_tax_rate=settings.dividend_tax_rate,
+        capital_gains_tax_rate=settings.capital_gains_tax_rate,
+        transaction_cost_rate=settings.transaction_cost_rate,
+        etf_info=etf_info,
+        currency_converter=converter,
+        kr_dividend_tax_rate=settings.kr_dividend_tax_rate,
+        kr_capital_gains_rate=settings.kr_capital_gains_rate
+    )
+
+    result = backtester.run(years=settings.backtest_years)
+
+    # 히스토리/연간 요약은 환율 조회가 필요하므로 backtester가 살아있을 때 함께 계산
+    history_df = backtester.get_portfolio_history_df(result)
+    annual_df = backtester.get_annual_summary_df(result)
+
+    return result, history_df, annual_df
+
+
+@st.fragment
 def _display_backtest_section(weights: dict, settings):
-    """백테스트 섹션"""
+    """
+    백테스트 섹션
+
+    fragment로 분리되어 있어 '백테스트 실행' 클릭 시 이 섹션만 재실행되고
+    다른 탭 (파이 차트, Efficient Frontier)은 다시 렌더링하지 않습니다.
+    """
     st.subheader("백테스트")
 
     st.markdown(
@@ -357,37 +520,54 @@ def _display_backtest_section(weights: dict, settings):
 
         try:
             with st.spinner("백테스트 실행 중..."):
-                # ETF 분류 및 환율 변환기 생성
-                etf_info = classify_portfolio(allocation)
-                converter = None
-                if needs_currency_conversion(etf_info, settings.base_currency):
-                    converter = CurrencyConverter(base_currency=settings.base_currency)
-
-                backtester = PortfolioBacktester(
-                    initial_capital=settings.initial_capital,
-                    allocation=allocation,
-                    rebalance_frequency=settings.rebalance_freq,
-                    withdrawal_rate=settings.withdrawal_rate,
-                    dividend_tax_rate=settings.dividend_tax_rate,
-                    capital_gains_tax_rate=settings.capital_gains_tax_rate,
-                    transaction_cost_rate=settings.transaction_cost_rate,
-                    etf_info=etf_info,
-                    currency_converter=converter,
-                    kr_dividend_tax_rate=settings.kr_dividend_tax_rate,
-                    kr_capital_gains_rate=settings.kr_capital_gains_rate
+                result, history_df, annual_df = _run_backtest(
+                    tuple(allocation.items()),
+                    settings
                 )
 
-                result = backtester.run(years=settings.backtest_years)
-
             # 결과 표시
-            _display_backtest_results(result, backtester, settings.base_currency)
+            _display_backtest_results(result, history_df, annual_df, settings.base_currency)
 
         except Exception as e:
             logger.error(f"Backtest error: {e}")
             st.error(f"백테스트 중 오류가 발생했습니다: {e}")
 
 
-def _display_backtest_results(result, backtester, base_currency: str):
+@st.cache_data(ttl=3600, show_spinner=False)
+def _build_value_figure(dates: np.ndarray, values: np.ndarray, base_currency: str) -> go.Figure:
+    """
+    포트폴리오 가치 추이 차트 생성 (캐싱)
+
+    Args:
+        dates: 날짜 배열
+        values: 포트폴리오 총 가치 배열
+        base_currency: 기준 통화
+    """
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=dates,
+        y=values,
+        mode='lines',
+        name='포트폴리오 가치',
+        fill='tozeroy',
+        line=dict(color='#1f77b4', width=2)
+    ))
+
+    fig.update_layout(
+        xaxis_title='날짜',
+        yaxis_title=f'가치 ({_currency_label(base_currency)})',
+        height=400,
+        hovermode='x unified'
+    )
+    return fig
+
+
+def _display_backtest_results(
+    result,
+    history_df: pd.DataFrame,
+    annual_df: pd.DataFrame,
+    base_currency: str
+):
     """백테스트 결과 표시"""
     st.markdown("---")
     st.subheader("백테스트 결과")
@@ -407,44 +587,26 @@ def _display_backtest_results(result, backtester, base_currency: str):
     # 포트폴리오 가치 차트
     st.markdown("**포트폴리오 가치 추이**")
 
-    df = backtester.get_portfolio_history_df(result)
-
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=df['date'],
-        y=df['total_value'],
-        mode='lines',
-        name='포트폴리오 가치',
-        fill='tozeroy',
-        line=dict(color='#1f77b4', width=2)
-    ))
-
-    fig.update_layout(
-        xaxis_title='날짜',
-        yaxis_title=f'가치 ({_currency_label(base_currency)})',
-        height=400,
-        hovermode='x unified'
+    fig = _build_value_figure(
+        history_df['date'].to_numpy(), history_df['total_value'].to_numpy(), base_currency
     )
-
     st.plotly_chart(fig, use_container_width=True)
 
     # 연간 요약
     st.markdown("**연간 성과 요약**")
-    annual_df = backtester.get_annual_summary_df(result)
 
     if not annual_df.empty:
-        # 컬럼 포맷팅
-        display_df = annual_df.copy()
-        for col in display_df.columns:
-            if col == '연도':
-                continue
-            elif '%' in col or '수익률' in col:
-                display_df[col] = display_df[col].apply(lambda x: f"{x:.1f}%")
-            else:
-                sym = _currency_symbol(base_currency)
-                display_df[col] = display_df[col].apply(lambda x, s=sym: f"{s}{x:,.0f}")
-
-        st.dataframe(display_df, hide_index=True, use_container_width=True)
+        # 컬럼 포맷팅 (숫자 dtype 유지, 표시 형식만 Styler로 지정)
+        sym = _currency_symbol(base_currency)
+        pct_fmt = '{:.1f}%'.format
+        money_fmt = (sym + '{:,.0f}').format
+        fmt = {
+            col: pct_fmt if ('%' in col or '수익률' in col or col.endswith('_pct')) else money_fmt
+            for col in annual_df.columns
+            if col not in ('year', '연도')
+        }
+
+        st.dataframe(annual_df.style.format(fmt), hide_index=True, use_container_width=True)
 
     # 총계
     st.markdown("**총계**")
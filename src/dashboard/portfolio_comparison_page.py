@@ -5,13 +5,20 @@
 """
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import os
+import threading
 import logging
 
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
 from src.backtest.portfolio_backtest import PortfolioBacktester, BacktestResult
 from src.backtest.backtest_utils import summarize_tax_events
+from src.data.data_fetcher import fetch_price_data, fetch_dividend_data
 from src.dashboard.sidebar_utils import render_common_sidebar
 from src.data.etf_classifier import (
     classify_portfolio, normalize_ticker, is_korean_ticker,
@@ -25,6 +32,12 @@ logger = logging.getLogger(__name__)
 # 포트폴리오별 색상
 PORTFOLIO_COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
 
+# 라인 차트 시리즈당 최대 포인트 수 (초과 시 균등 간격 샘플링)
+MAX_CHART_POINTS = 2000
+
+# 종목 데이터 동시 조회 스레드 수 상한
+MAX_FETCH_WORKERS = 8
+
 
 def _comp_currency_symbol(base_currency: str) -> str:
     """기준 통화 기호 반환"""
@@ -36,6 +49,88 @@ def _comp_currency_label(base_currency: str) -> str:
     return base_currency
 
 
+def _load_market_data(
+    symbols: tuple,
+    start_date: datetime,
+    end_date: datetime
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, pd.Series]]:
+    """
+    비교 대상 전체 종목의 가격/배당 데이터를 종목당 한 번만 조회
+
+    포트폴리오 간 겹치는 종목 (SPY, QQQ 등)을 백테스트마다 다시 조회하지 않도록
+    합집합으로 한 번 로드해 각 백테스터에 공유합니다.
+    종목별 조회는 네트워크 대기가 대부분이므로 스레드 풀로 동시에 수행합니다.
+
+    Args:
+        symbols: 전체 종목 튜플 (중복 없음)
+        start_date: 시작일
+        end_date: 종료일
+
+    Returns:
+        (price_data, dividend_data) 종목별 딕셔너리 튜플
+    """
+    start_str = str(start_date.date())
+    end_str = str(end_date.date())
+
+    def _load(symbol: str) -> Tuple[pd.DataFrame, pd.Series]:
+        return (
+            fetch_price_data(symbol, start_str, end_str),
+            fetch_dividend_data(symbol, start_str, end_str)
+        )
+
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_FETCH_WORKERS, len(symbols))),
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+    ) as executor:
+        loaded = list(executor.map(_load, symbols))
+
+    price_data = {symbol: prices for symbol, (prices, _) in zip(symbols, loaded)}
+    dividend_data = {symbol: dividends for symbol, (_, dividends) in zip(symbols, loaded)}
+    return price_data, dividend_data
+
+
+def _run_portfolio_backtest(
+    allocation: Dict[str, float],
+    common_params: Dict,
+    base_currency: str,
+    start_date: datetime,
+    end_date: datetime,
+    price_data: Dict[str, pd.DataFrame] = None,
+    dividend_data: Dict[str, pd.Series] = None
+) -> Tuple[PortfolioBacktester, BacktestResult]:
+    """
+    포트폴리오 1개 백테스트 실행 (프로세스 풀 워커용, 인자/반환값은 pickle 가능해야 함)
+
+    Args:
+        allocation: 자산 배분 {symbol: weight}
+        common_params: PortfolioBacktester 공통 설정
+        base_currency: 기준 통화
+        start_date: 시작일
+        end_date: 종료일
+        price_data: 미리 로드된 종목별 가격 데이터
+        dividend_data: 미리 로드된 종목별 배당금 데이터
+
+    Returns:
+        (backtester, result) 튜플
+    """
+    etf_info = classify_portfolio(allocation)
+    converter = None
+    if needs_currency_conversion(etf_info, base_currency):
+        converter = CurrencyConverter(base_currency=base_currency)
+
+    backtester = PortfolioBacktester(
+        allocation=allocation,
+        etf_info=etf_info,
+        currency_converter=converter,
+        # 해당 포트폴리오 종목만 전달 (다른 종목의 거래일이 거래일 합집합에 추가되지 않도록)
+        price_data={s: df for s, df in (price_data or {}).items() if s in allocation},
+        dividend_data={s: div for s, div in (dividend_data or {}).items() if s in allocation},
+        **common_params
+    )
+    return backtester, backtester.run(start_date, end_date)
+
+
 def show_portfolio_comparison_page():
     """포트폴리오 비교 페이지 표시"""
     st.header("포트폴리오 비교")
@@ -112,15 +207,18 @@ def show_portfolio_comparison_page():
 
     num_portfolios = len(portfolios)
 
-    # 컬럼 생성 및 포트폴리오 할당 UI 렌더링
-    cols = st.columns(num_portfolios)
-    allocations = []
+    # 포트폴리오 구성(추가/삭제/비중)은 폼으로 묶어 제출 시 한 번만 재실행
+    with st.form("compare_form", border=False):
+        cols = st.columns(num_portfolios)
+        allocations = []
 
-    for col, (name, default_allocation, key_prefix) in zip(cols, portfolios):
-        with col:
-            st.subheader(name)
-            allocation = _render_portfolio_allocation(default_allocation, key_prefix)
-            allocations.append(allocation)
+        for col, (name, portfolio, key_prefix) in zip(cols, portfolios):
+            with col:
+                st.subheader(name)
+                allocations.append(_render_portfolio_allocation(portfolio, key_prefix))
+
+        st.markdown("---")
+        submitted = st.form_submit_button("비교 실행", type="primary")
 
     # 개별 변수에 할당 (하위 호환성 유지)
     allocation_1 = allocations[0]
@@ -128,19 +226,19 @@ def show_portfolio_comparison_page():
     allocation_3 = allocations[2] if num_portfolios >= 3 else None
     allocation_4 = allocations[3] if num_portfolios >= 4 else None
     allocation_5 = allocations[4] if num_portfolios >= 5 else None
-    
-    st.markdown("---")
-    
-    # 비교 실행 버튼 - 유효성 검사
+
+    # 비교 실행 - 유효성 검사 (폼 제출 전에는 합계를 알 수 없으므로 제출 시 검사)
     valid_1 = abs(sum(allocation_1.values()) - 1.0) <= 0.01
     valid_2 = abs(sum(allocation_2.values()) - 1.0) <= 0.01
     valid_3 = True if not enable_portfolio_3 else abs(sum(allocation_3.values()) - 1.0) <= 0.01
     valid_4 = True if not enable_portfolio_4 else abs(sum(allocation_4.values()) - 1.0) <= 0.01
     valid_5 = True if not enable_portfolio_5 else abs(sum(allocation_5.values()) - 1.0) <= 0.01
 
-    all_valid = valid_1 and valid_2 and valid_3 and valid_4 and valid_5
+    if submitted:
+        # 편집 결과를 세션 상태에 반영 (페이지 전환/포트폴리오 비활성화 후에도 유지)
+        for (_, portfolio, key_prefix), allocation in zip(portfolios, allocations):
+            _save_portfolio_allocation(portfolio, allocation, key_prefix)
 
-    if st.button("비교 실행", type="primary", disabled=not all_valid):
         if not valid_1:
             st.error("포트폴리오 1의 비중 합계가 100%가 아닙니다.")
             return
@@ -175,73 +273,47 @@ def show_portfolio_comparison_page():
                 'kr_capital_gains_rate': settings.kr_capital_gains_rate
             }
 
-            def _create_backtester(alloc):
-                etf_info = classify_portfolio(alloc)
-                converter = None
-                if needs_currency_conversion(etf_info, base_currency):
-                    converter = CurrencyConverter(base_currency=base_currency)
-                return PortfolioBacktester(
-                    allocation=alloc,
-                    etf_info=etf_info,
-                    currency_converter=converter,
-                    **common_params
-                )
-
-            # 포트폴리오 1 백테스트
-            backtester_1 = _create_backtester(allocation_1)
-            result_1 = backtester_1.run(start_date, end_date)
-
-            # 포트폴리오 2 백테스트
-            backtester_2 = _create_backtester(allocation_2)
-            result_2 = backtester_2.run(start_date, end_date)
-
-            # 포트폴리오 3 백테스트 (활성화된 경우)
-            backtester_3 = None
-            result_3 = None
-            if enable_portfolio_3:
-                backtester_3 = _create_backtester(allocation_3)
-                result_3 = backtester_3.run(start_date, end_date)
-
-            # 포트폴리오 4 백테스트 (활성화된 경우)
-            backtester_4 = None
-            result_4 = None
-            if enable_portfolio_4:
-                backtester_4 = _create_backtester(allocation_4)
-                result_4 = backtester_4.run(start_date, end_date)
-
-            # 포트폴리오 5 백테스트 (활성화된 경우)
-            backtester_5 = None
-            result_5 = None
-            if enable_portfolio_5:
-                backtester_5 = _create_backtester(allocation_5)
-                result_5 = backtester_5.run(start_date, end_date)
+            # 포트폴리오 간 겹치는 종목은 한 번만 조회
+            all_symbols = tuple(dict.fromkeys(symbol for alloc in allocations for symbol in alloc))
+            price_data, dividend_data = _load_market_data(all_symbols, start_date, end_date)
+
+            # 시뮬레이션은 GIL에 묶이는 CPU 연산이므로 프로세스 풀로 병렬 실행
+            # (가격/배당 데이터는 미리 로드된 딕셔너리라 워커에서 재조회하지 않음)
+            progress = st.progress(0.0, text=f"0/{num_portfolios} 완료")
+            partial = st.empty()
+            partial_lines = []
+
+            with ProcessPoolExecutor(
+                max_workers=min(num_portfolios, os.cpu_count() or 1)
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _run_portfolio_backtest, alloc, common_params, base_currency,
+                        start_date, end_date, price_data, dividend_data
+                    ): i
+                    for i, alloc in enumerate(allocations)
+                }
+                # 완료되는 순서대로 진행률과 핵심 지표를 먼저 표시
+                for done, future in enumerate(as_completed(futures), start=1):
+                    _, result = future.result()
+                    progress.progress(done / num_portfolios, text=f"{done}/{num_portfolios} 완료")
+                    partial_lines.append(
+                        f"포트폴리오 {futures[future] + 1} 완료 — "
+                        f"CAGR {result.cagr:.1f}%, 최대 낙폭 {result.max_drawdown:.1f}%"
+                    )
+                    partial.caption("  \n".join(partial_lines))
+
+                backtesters, results = zip(*(future.result() for future in futures))
+
+            progress.empty()
+            partial.empty()
         
         st.success("비교 완료!")
 
-        # 결과 수집
-        backtesters = [backtester_1, backtester_2]
-        results = [result_1, result_2]
-        allocations = [allocation_1, allocation_2]
-
-        if enable_portfolio_3:
-            backtesters.append(backtester_3)
-            results.append(result_3)
-            allocations.append(allocation_3)
-
-        if enable_portfolio_4:
-            backtesters.append(backtester_4)
-            results.append(result_4)
-            allocations.append(allocation_4)
-
-        if enable_portfolio_5:
-            backtesters.append(backtester_5)
-            results.append(result_5)
-            allocations.append(allocation_5)
-        
         # 결과 표시
         _display_comparison_results(
-            backtesters=backtesters,
-            results=results,
+            backtesters=list(backtesters),
+            results=list(results),
             allocations=allocations,
             initial_capital=initial_capital,
             base_currency=base_currency
@@ -249,51 +321,39 @@ def show_portfolio_comparison_page():
 
 
 def _render_portfolio_allocation(portfolio: dict, key_prefix: str) -> dict:
-    """포트폴리오 자산 배분 UI 렌더링"""
-
-    # ETF 추가
-    col_add1, col_add2 = st.columns([3, 1])
-
-    with col_add1:
-        new_etf = st.text_input(
-            "ETF 추가",
-            placeholder="예: VOO, TLT, 069500",
-            key=f"{key_prefix}_new_etf"
-        ).strip()
-
-    with col_add2:
-        st.markdown("<br>", unsafe_allow_html=True)
-        if st.button("추가", key=f"{key_prefix}_add_btn", type="secondary"):
-            if new_etf:
-                normalized = normalize_ticker(new_etf)
-                if normalized not in portfolio:
-                    portfolio[normalized] = 0.0
-                    st.rerun()
-    
-    # 배분 입력
+    """포트폴리오 자산 배분 UI 렌더링 (ETF 추가/삭제/비중 수정을 하나의 테이블에서 처리)"""
+    editor_df = pd.DataFrame({
+        'ETF': list(portfolio.keys()),
+        '비중 (%)': [weight * 100 for weight in portfolio.values()],
+    })
+
+    edited = st.data_editor(
+        editor_df,
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            'ETF': st.column_config.TextColumn(
+                'ETF', help="예: VOO, TLT, 069500", required=True
+            ),
+            '비중 (%)': st.column_config.NumberColumn(
+                '비중 (%)', min_value=0.0, max_value=100.0, step=5.0,
+                format="%.1f", default=0.0
+            ),
+        },
+        key=f"{key_prefix}_editor_{st.session_state.get(f'{key_prefix}_editor_version', 0)}"
+    )
+
+    # 티커 정규화 (같은 티커가 여러 행이면 비중 합산)
     allocation = {}
-    
-    for symbol in list(portfolio.keys()):
-        col_weight, col_del = st.columns([4, 1])
-        
-        with col_weight:
-            weight = st.number_input(
-                f"{symbol} (%)",
-                min_value=0.0,
-                max_value=100.0,
-                value=portfolio[symbol] * 100,
-                step=5.0,
-                key=f"{key_prefix}_weight_{symbol}"
-            )
-            allocation[symbol] = weight / 100
-        
-        with col_del:
-            st.markdown("<br>", unsafe_allow_html=True)
-            if st.button("삭제", key=f"{key_prefix}_del_{symbol}", type="secondary"):
-                del portfolio[symbol]
-                st.rerun()
-    
-    # 합계 표시
+    for symbol, weight in zip(edited['ETF'], edited['비중 (%)']):
+        if not isinstance(symbol, str) or not symbol.strip():
+            continue
+        normalized = normalize_ticker(symbol.strip())
+        weight = 0.0 if pd.isna(weight) else float(weight)
+        allocation[normalized] = allocation.get(normalized, 0.0) + weight / 100
+
+    # 합계 표시 (마지막 제출 기준)
     total = sum(allocation.values())
     if abs(total - 1.0) <= 0.01:
         st.success(f"합계: {total * 100:.1f}%")
@@ -303,6 +363,21 @@ def _render_portfolio_allocation(portfolio: dict, key_prefix: str) -> dict:
     return allocation
 
 
+def _save_portfolio_allocation(portfolio: dict, allocation: dict, key_prefix: str):
+    """
+    편집된 배분을 세션 상태의 포트폴리오 딕셔너리에 반영
+
+    에디터는 원본 데이터 대비 편집 내역을 보관하므로, 원본이 바뀌면
+    키 버전을 올려 새 원본으로 다시 생성합니다 (편집 내역 중복 적용 방지).
+    """
+    if portfolio == allocation:
+        return
+    portfolio.clear()
+    portfolio.update(allocation)
+    version_key = f"{key_prefix}_editor_version"
+    st.session_state[version_key] = st.session_state.get(version_key, 0) + 1
+
+
 def _render_summary_table(
     results: List[BacktestResult],
     num_portfolios: int,
@@ -312,94 +387,87 @@ def _render_summary_table(
 
     st.markdown("### 성과 요약")
 
+    # 세금 이벤트는 포트폴리오당 한 번만 집계하여 재사용
+    tax_summaries = [summarize_tax_events(r.tax_events) for r in results]
+
     # KR 매매차익세 여부 확인
-    has_kr_tax = any(
-        summarize_tax_events(r.tax_events)['kr_capital_gains_tax'] > 0
-        for r in results
-    )
+    has_kr_tax = any(t['kr_capital_gains_tax'] > 0 for t in tax_summaries)
 
     sym = _comp_currency_symbol(base_currency)
 
-    metrics_labels = [
-        f"최종 자산 ({sym})",
-        "총 수익률 (%)",
-        "CAGR (%)",
-        "변동성 (%)",
-        "샤프비율",
-        "최대 낙폭 (%)",
-        f"총 인출금 ({sym})",
-        f"총 배당금(세후) ({sym})",
-        f"총 세금 ({sym})",
-        f"총 세금(배당) ({sym})",
-        f"총 세금(양도) ({sym})",
+    # (지표명, 소수 자릿수, 포트폴리오별 값)
+    rows = [
+        (f"최종 자산 ({sym})", 0, [r.final_value for r in results]),
+        ("총 수익률 (%)", 1, [r.total_return for r in results]),
+        ("CAGR (%)", 1, [r.cagr for r in results]),
+        ("변동성 (%)", 1, [r.volatility for r in results]),
+        ("샤프비율", 2, [r.sharpe_ratio for r in results]),
+        ("최대 낙폭 (%)", 1, [r.max_drawdown for r in results]),
+        (f"총 인출금 ({sym})", 0, [r.total_withdrawal for r in results]),
+        (f"총 배당금(세후) ({sym})", 0, [r.total_dividend_net for r in results]),
+        (f"총 세금 ({sym})", 0, [r.total_tax for r in results]),
+        (f"총 세금(배당) ({sym})", 0, [t['dividend_tax'] for t in tax_summaries]),
+        (f"총 세금(양도) ({sym})", 0, [t['capital_gains_tax'] for t in tax_summaries]),
     ]
     if has_kr_tax:
-        metrics_labels.append(f"총 세금(국내 매매) ({sym})")
-    metrics_labels.append(f"총 거래비용 ({sym})")
-
-    summary_data = {"지표": metrics_labels}
-
-    def _result_values(result):
-        tax_summary = summarize_tax_events(result.tax_events)
-        values = [
-            int(round(result.final_value)),
-            round(result.total_return, 1),
-            round(result.cagr, 1),
-            round(result.volatility, 1),
-            round(result.sharpe_ratio, 2),
-            round(result.max_drawdown, 1),
-            int(round(result.total_withdrawal)),
-            int(round(result.total_dividend_net)),
-            int(round(result.total_tax)),
-            int(round(tax_summary['dividend_tax'])),
-            int(round(tax_summary['capital_gains_tax'])),
-        ]
-        if has_kr_tax:
-            values.append(int(round(tax_summary['kr_capital_gains_tax'])))
-        values.append(int(round(result.total_transaction_cost)))
-        return values
-
-    # 각 포트폴리오 결과 추가
-    for i, result in enumerate(results):
-        summary_data[f"포트폴리오 {i+1}"] = _result_values(result)
-
-    # 차이 컬럼 추가 (포트폴리오 1 기준)
-    vals_1 = _result_values(results[0])
-
-    for idx in range(1, num_portfolios):
-        vals_n = _result_values(results[idx])
-        diff = []
-        for v1, vn in zip(vals_1, vals_n):
-            if isinstance(v1, int):
-                diff.append(int(round(v1 - vn)))
-            else:
-                diff.append(round(v1 - vn, 2))
-        summary_data[f"1 vs {idx+1}"] = diff
-
-    summary_df = pd.DataFrame(summary_data)
+        rows.append((f"총 세금(국내 매매) ({sym})", 0, [t['kr_capital_gains_tax'] for t in tax_summaries]))
+    rows.append((f"총 거래비용 ({sym})", 0, [r.total_transaction_cost for r in results]))
+
+    labels, decimals, values = zip(*rows)
+    scale = 10.0 ** np.array(decimals)[:, None]
+    metrics = np.round(np.array(values, dtype=float) * scale) / scale
+
+    # 차이 컬럼 (포트폴리오 1 기준)
+    diffs = np.round((metrics[:, :1] - metrics[:, 1:]) * scale) / scale
+    columns = (
+        [f"포트폴리오 {i+1}" for i in range(num_portfolios)]
+        + [f"1 vs {idx+1}" for idx in range(1, num_portfolios)]
+    )
+
+    summary_df = pd.DataFrame(
+        np.column_stack([metrics, diffs]),
+        index=pd.Index(labels, name="지표"),
+        columns=columns
+    ).reset_index()
     st.dataframe(summary_df, use_container_width=True, hide_index=True)
 
 
-def _render_portfolio_value_chart(
-    histories: List[pd.DataFrame],
-    initial_capital: float,
-    base_currency: str = "USD"
-):
-    """포트폴리오 가치 추이 차트 렌더링"""
+def _downsample_history(history: pd.DataFrame, max_points: int = MAX_CHART_POINTS) -> pd.DataFrame:
+    """차트용 히스토리 샘플링 (마지막 포인트는 항상 포함)"""
+    n = len(history)
+    if n <= max_points:
+        return history
+    positions = np.unique(np.append(np.arange(0, n, -(-n // max_points)), n - 1))
+    return history.iloc[positions]
 
-    st.markdown("---")
-    st.markdown("### 포트폴리오 가치 추이")
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _build_value_chart_figure(
+    dates: tuple,
+    values: tuple,
+    initial_capital: float,
+    base_currency: str
+) -> go.Figure:
+    """
+    포트폴리오 가치 비교 차트 생성 (캐싱)
+
+    Args:
+        dates: 포트폴리오별 날짜 배열 튜플
+        values: 포트폴리오별 총 가치 배열 튜플
+        initial_capital: 초기 자본
+        base_currency: 기준 통화
+    """
     fig = go.Figure()
-
-    for i, history in enumerate(histories):
-        fig.add_trace(go.Scatter(
-            x=history['date'],
-            y=history['total_value'],
+    fig.add_traces([
+        go.Scattergl(
+            x=x,
+            y=y,
             mode='lines',
             name=f'포트폴리오 {i+1}',
-            line=dict(color=PORTFOLIO_COLORS[i], width=2)
-        ))
+            line=dict(color=color, width=2)
+        )
+        for i, (x, y, color) in enumerate(zip(dates, values, PORTFOLIO_COLORS))
+    ])
 
     # 초기 자본 기준선
     sym = _comp_currency_symbol(base_currency)
@@ -425,29 +493,54 @@ def _render_portfolio_value_chart(
             x=1
         )
     )
+    return fig
 
-    st.plotly_chart(fig, use_container_width=True)
 
-
-def _render_cumulative_returns_chart(
+def _render_portfolio_value_chart(
     histories: List[pd.DataFrame],
-    initial_capital: float
+    initial_capital: float,
+    base_currency: str = "USD"
 ):
-    """누적 수익률 비교 차트 렌더링"""
+    """포트폴리오 가치 추이 차트 렌더링"""
 
-    st.markdown("### 누적 수익률 비교")
+    st.markdown("---")
+    st.markdown("### 포트폴리오 가치 추이")
 
-    fig = go.Figure()
+    sampled = [_downsample_history(history) for history in histories]
+    fig = _build_value_chart_figure(
+        tuple(history['date'].to_numpy() for history in sampled),
+        tuple(history['total_value'].to_numpy() for history in sampled),
+        initial_capital,
+        base_currency
+    )
+    st.plotly_chart(fig, use_container_width=True)
 
-    for i, history in enumerate(histories):
-        returns = (history['total_value'] / initial_capital - 1) * 100
-        fig.add_trace(go.Scatter(
-            x=history['date'],
-            y=returns,
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _build_cumulative_returns_figure(
+    dates: tuple,
+    values: tuple,
+    initial_capital: float
+) -> go.Figure:
+    """
+    누적 수익률 비교 차트 생성 (캐싱)
+
+    Args:
+        dates: 포트폴리오별 날짜 배열 튜플
+        values: 포트폴리오별 총 가치 배열 튜플
+        initial_capital: 초기 자본
+    """
+    fig = go.Figure()
+    fig.add_traces([
+        go.Scattergl(
+            x=x,
+            y=(y / initial_capital - 1) * 100,
             mode='lines',
             name=f'포트폴리오 {i+1}',
-            line=dict(color=PORTFOLIO_COLORS[i], width=2)
-        ))
+            line=dict(color=color, width=2)
+        )
+        for i, (x, y, color) in enumerate(zip(dates, values, PORTFOLIO_COLORS))
+    ])
 
     fig.add_hline(y=0, line_dash="dash", line_color="gray")
 
@@ -465,10 +558,63 @@ def _render_cumulative_returns_chart(
             x=1
         )
     )
+    return fig
+
+
+def _render_cumulative_returns_chart(
+    histories: List[pd.DataFrame],
+    initial_capital: float
+):
+    """누적 수익률 비교 차트 렌더링"""
 
+    st.markdown("### 누적 수익률 비교")
+
+    sampled = [_downsample_history(history) for history in histories]
+    fig = _build_cumulative_returns_figure(
+        tuple(history['date'].to_numpy() for history in sampled),
+        tuple(history['total_value'].to_numpy() for history in sampled),
+        initial_capital
+    )
     st.plotly_chart(fig, use_container_width=True)
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _build_annual_comparison_figure(years: tuple, returns: tuple) -> go.Figure:
+    """
+    연간 수익률 비교 차트 생성 (캐싱)
+
+    Args:
+        years: 포트폴리오별 연도 배열 튜플
+        returns: 포트폴리오별 연간 수익률(%) 배열 튜플
+    """
+    fig = go.Figure()
+    fig.add_traces([
+        go.Bar(
+            x=x,
+            y=y,
+            name=f'포트폴리오 {i+1}',
+            marker_color=color
+        )
+        for i, (x, y, color) in enumerate(zip(years, returns, PORTFOLIO_COLORS))
+    ])
+
+    fig.update_layout(
+        title="연간 수익률 비교",
+        xaxis_title="연도",
+        yaxis_title="수익률 (%)",
+        height=400,
+        barmode='group',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    return fig
+
+
 def _render_annual_comparison_chart(
     backtesters: List[PortfolioBacktester],
     results: List[BacktestResult]
@@ -484,31 +630,10 @@ def _render_annual_comparison_chart(
 
     # 모든 연간 데이터가 있는지 확인
     if all(not annual.empty for annual in annual_summaries):
-        fig = go.Figure()
-
-        for i, annual in enumerate(annual_summaries):
-            fig.add_trace(go.Bar(
-                x=annual['year'],
-                y=annual['return_pct'],
-                name=f'포트폴리오 {i+1}',
-                marker_color=PORTFOLIO_COLORS[i]
-            ))
-
-        fig.update_layout(
-            title="연간 수익률 비교",
-            xaxis_title="연도",
-            yaxis_title="수익률 (%)",
-            height=400,
-            barmode='group',
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
+        fig = _build_annual_comparison_figure(
+            tuple(annual['year'].to_numpy() for annual in annual_summaries),
+            tuple(annual['return_pct'].to_numpy() for annual in annual_summaries)
         )
-
         st.plotly_chart(fig, use_container_width=True)
 
 
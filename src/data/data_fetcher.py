@@ -149,25 +149,39 @@ def fetch_adjusted_prices(
     Returns:
         DataFrame with ticker columns, tz-naive DatetimeIndex
     """
-    prices = pd.DataFrame()
-
-    for ticker in tickers:
-        try:
-            data = yf.download(ticker, start=start_date, end=end_date, progress=False)
-            if len(data) > 0:
-                if 'Adj Close' in data.columns:
-                    prices[ticker] = data['Adj Close']
-                elif ('Adj Close', ticker) in data.columns:
-                    prices[ticker] = data[('Adj Close', ticker)]
-                else:
-                    prices[ticker] = data['Close']
-        except Exception as e:
-            logger.error(f"Error fetching {ticker}: {e}")
-            raise ValueError(f"티커 '{ticker}' 데이터를 가져올 수 없습니다.")
+    # 전체 티커를 한 번에 요청 (yfinance 내부 스레드로 병렬 다운로드)
+    try:
+        data = yf.download(
+            list(tickers),
+            start=start_date,
+            end=end_date,
+            auto_adjust=True,
+            group_by='column',
+            threads=True,
+            progress=False
+        )
+    except Exception as e:
+        logger.error(f"Error fetching {list(tickers)}: {e}")
+        raise ValueError("가격 데이터를 가져올 수 없습니다.")
 
-    if prices.empty:
+    if data is None or data.empty or 'Close' not in data.columns.get_level_values(0):
         raise ValueError("가격 데이터를 가져올 수 없습니다.")
 
+    # auto_adjust=True이므로 Close가 조정 종가, 호출자 티커 순서로 정렬
+    prices = data['Close']
+    if isinstance(prices, pd.Series):
+        prices = prices.to_frame(name=tickers[0])
+    prices = prices.reindex(columns=list(tickers))
+
+    # 다운로드에 실패했거나 응답에 없는 티커는 전 구간 NaN → 전부 모아서 한 번에 보고
+    missing = prices.columns[prices.isna().all()].tolist()
+    if missing:
+        logger.error(f"Error fetching {missing}")
+        raise ValueError(f"티커 {', '.join(repr(t) for t in missing)} 데이터를 가져올 수 없습니다.")
+
+    prices.index = _normalize_timezone(pd.DatetimeIndex(prices.index))
+    prices.columns.name = None
+
     prices = prices.dropna()
 
     if len(prices) < min_days:
@@ -66,6 +66,10 @@ KOREAN_ETF_REGISTRY: Dict[str, tuple] = {
 }
 
 
+# 정규화된 티커 형식: yfinance 심볼 문자 집합 (예: SPY, BRK-B, 069500.KS, BTC-USD, ^GSPC, GC=F, 0700.HK)
+TICKER_PATTERN = re.compile(r'^[\^A-Z0-9][A-Z0-9.\-=]{0,14}$')
+
+
 def is_korean_ticker(ticker: str) -> bool:
     """한국 티커 여부 판별
 
@@ -103,6 +107,20 @@ def normalize_ticker(user_input: str) -> str:
     return stripped.upper()
 
 
+def is_valid_ticker(ticker: str) -> bool:
+    """정규화된 티커의 형식 검증
+
+    yfinance 조회 전에 명백히 잘못된 입력을 걸러냅니다 (존재 여부는 확인하지 않음).
+
+    Args:
+        ticker: normalize_ticker()로 정규화된 티커
+
+    Returns:
+        형식이 올바르면 True
+    """
+    return TICKER_PATTERN.match(ticker) is not None
+
+
 def classify_etf(ticker: str) -> ETFInfo:
     """ETF 분류 정보 반환
 
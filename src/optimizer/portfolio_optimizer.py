@@ -1,7 +1,7 @@
 """
 포트폴리오 최적화 엔진
 
-PyPortfolioOpt를 활용한 Mean-Variance Optimization 구현
+NumPy/SciPy 기반 Mean-Variance Optimization 구현
 - Max Sharpe Ratio
 - Min Volatility
 - Efficient Frontier 시각화
@@ -13,21 +13,292 @@ from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 import logging
 
-from pypfopt import EfficientFrontier
-from pypfopt import risk_models
-from pypfopt import expected_returns
+from scipy.linalg import cho_factor, cho_solve
+from scipy.optimize import minimize
 
 from config.settings import BACKTEST_CONSTANTS, DASHBOARD_CONSTANTS
 from src.data.data_fetcher import fetch_adjusted_prices
 
 logger = logging.getLogger(__name__)
 
+# 비중 정리 기준 (PyPortfolioOpt clean_weights 기본값과 동일)
+WEIGHT_CUTOFF = 1e-4
+WEIGHT_ROUNDING = 5
+
+# SLSQP 옵션 (해석적 기울기 사용 시 수십 회 이내 수렴)
+SOLVER_OPTIONS = {'ftol': 1e-12, 'maxiter': 200}
+
+# frontier 포인트의 목표 수익률 허용 오차
+RETURN_TOLERANCE = 1e-8
+
+# 연율화 기준 거래일 수
+TRADING_DAYS_PER_YEAR = 252
+
+
+def _ledoit_wolf_cov(returns: np.ndarray) -> np.ndarray:
+    """
+    Ledoit-Wolf 수축 공분산 행렬 (일별 기준)
+
+    표본 공분산을 scaled identity (평균 분산 × I) 쪽으로 수축합니다.
+    수축 강도는 Ledoit & Wolf (2004) 추정식으로 계산합니다
+    (sklearn.covariance.ledoit_wolf와 동일).
+
+    Args:
+        returns: (T, n) 일별 수익률 행렬 (float32/float64)
+
+    Returns:
+        (n, n) 공분산 행렬 (입력과 같은 dtype)
+    """
+    n_samples, n_features = returns.shape
+    X = returns - returns.mean(axis=0)
+
+    emp_cov = X.T @ X / n_samples
+    target = np.trace(emp_cov) / n_features
+
+    X2 = X ** 2
+    beta_ = np.sum(X2.T @ X2) / n_samples
+    delta_ = np.sum(emp_cov ** 2)
+    beta = (beta_ - delta_) / (n_features * n_samples)
+    delta = (delta_ - 2 * target * np.trace(emp_cov) + n_features * target ** 2) / n_features
+    beta = min(beta, delta)
+    shrinkage = 0.0 if beta == 0 else beta / delta
+
+    shrunk = (1.0 - shrinkage) * emp_cov
+    shrunk.flat[::n_features + 1] += shrinkage * target
+    return shrunk
+
+
+def _covariance_factor(S: np.ndarray) -> np.ndarray:
+    """
+    공분산 행렬 분해 인자 L 계산 (Σ = LLᵀ)
+
+    Cholesky 분해를 사용하고, 수치적으로 특이한 경우
+    대칭 고유값 분해 (음수 고유값은 0으로 절단)로 대체합니다.
+    """
+    n = S.shape[0]
+    try:
+        return np.linalg.cholesky(S + 1e-10 * np.eye(n))
+    except np.linalg.LinAlgError:
+        logger.warning("공분산 행렬이 양의 정부호가 아닙니다. 고유값 분해로 대체합니다.")
+        eigvals, eigvecs = np.linalg.eigh(S)
+        return eigvecs * np.sqrt(np.clip(eigvals, 0.0, None))
+
+
+def _portfolio_variance(w: np.ndarray, L: np.ndarray) -> float:
+    """포트폴리오 분산 w'Σw = ||Lᵀw||²"""
+    z = L.T @ w
+    return z @ z
+
+
+def _portfolio_variance_grad(w: np.ndarray, L: np.ndarray) -> np.ndarray:
+    """포트폴리오 분산의 기울기 2Σw = 2L(Lᵀw)"""
+    return 2.0 * (L @ (L.T @ w))
+
+
+def _excess_return(w: np.ndarray, mu: np.ndarray, target: float) -> float:
+    """기대수익률 μ'w 와 기준값의 차이 (제약식용)"""
+    return mu @ w - target
+
+
+def _excess_return_grad(w: np.ndarray, mu: np.ndarray, target: float) -> np.ndarray:
+    """기대수익률 제약식의 기울기 μ"""
+    return mu
+
+
+def _weight_sum_gap(w: np.ndarray) -> float:
+    """비중 합계 1 제약식"""
+    return w.sum() - 1.0
+
+
+def _weight_sum_gap_grad(w: np.ndarray) -> np.ndarray:
+    """비중 합계 제약식의 기울기 1"""
+    return np.ones_like(w)
+
+
+def _clean_weights(weights: np.ndarray) -> np.ndarray:
+    """미세 비중 제거 및 반올림"""
+    cleaned = np.where(np.abs(weights) < WEIGHT_CUTOFF, 0.0, weights)
+    return np.round(cleaned, WEIGHT_ROUNDING)
+
+
+def _solve_max_sharpe(
+    mu: np.ndarray,
+    S: np.ndarray,
+    L: np.ndarray,
+    risk_free_rate: float
+) -> np.ndarray:
+    """
+    Max Sharpe 비중 계산 (Charnes-Cooper 변환)
+
+    비율 목적함수 (μ'w - rf) / √(w'Σw) 대신 동치인 볼록 QP를 풉니다:
+        minimize  y'Σy
+        s.t.      (μ - rf)'y = 1,  y >= 0
+    최적해를 w = y / Σy 로 역변환합니다 (long-only).
+
+    제약 없는 해 y ∝ Σ⁻¹(μ - rf) (접점 포트폴리오)가 모두 0 이상이면
+    비음 제약이 비활성이므로 QP 없이 그대로 사용합니다.
+
+    Raises:
+        ValueError: 무위험수익률을 초과하는 자산이 없는 경우
+    """
+    excess = mu - risk_free_rate
+    if not (excess > 0).any():
+        raise ValueError("무위험수익률을 초과하는 기대수익률을 가진 자산이 없어 Max Sharpe 최적화를 할 수 없습니다.")
+
+    # 접점 포트폴리오: (μ - rf)'Σ⁻¹(μ - rf) > 0 이므로 Σz > 0 이면 초과수익률도 양수
+    z = _cov_solve(S, excess)
+    if z is not None and z.sum() > 0 and z.min() >= 0.0:
+        return z / z.sum()
+
+    # 초기값: 초과수익률 양수 자산 균등 배분을 제약식에 맞게 스케일
+    y0 = np.where(excess > 0, 1.0, 0.0)
+    y0 /= excess @ y0
+
+    result = minimize(
+        _portfolio_variance,
+        y0,
+        args=(L,),
+        jac=_portfolio_variance_grad,
+        method='SLSQP',
+        bounds=[(0.0, None)] * len(mu),
+        constraints=[{
+            'type': 'eq', 'fun': _excess_return, 'jac': _excess_return_grad, 'args': (excess, 1.0)
+        }],
+        options=SOLVER_OPTIONS
+    )
+    if not result.success:
+        logger.warning(f"Max Sharpe solver did not converge: {result.message}")
+
+    y = np.maximum(result.x, 0.0)
+    return y / y.sum()
+
+
+def _minimize_variance(
+    L: np.ndarray,
+    x0: np.ndarray,
+    constraints: List[Dict]
+):
+    """
+    Long-only 최소분산 QP 공통 풀이
+
+        minimize  w'Σw
+        s.t.      Σw = 1,  0 <= w <= 1,  (추가 제약)
+
+    Returns:
+        scipy OptimizeResult
+    """
+    return minimize(
+        _portfolio_variance,
+        x0,
+        args=(L,),
+        jac=_portfolio_variance_grad,
+        method='SLSQP',
+        bounds=[(0.0, 1.0)] * len(x0),
+        constraints=[{'type': 'eq', 'fun': _weight_sum_gap, 'jac': _weight_sum_gap_grad}] + constraints,
+        options=SOLVER_OPTIONS
+    )
+
+
+def _cov_solve(S: np.ndarray, B: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Σ⁻¹B 계산 (역행렬 대신 Cholesky 분해 후 전진/후진 대입)
+
+    Returns:
+        Σ⁻¹B, Σ가 양의 정부호가 아니면 None
+    """
+    try:
+        factor = cho_factor(S, lower=True)
+    except np.linalg.LinAlgError:
+        return None
+    return cho_solve(factor, B)
+
+
+def _solve_min_volatility(S: np.ndarray, L: np.ndarray) -> np.ndarray:
+    """
+    Min Volatility 비중 계산 (long-only)
+
+    전역 최소분산 해석해 w = Σ⁻¹1 / 1'Σ⁻¹1 이 모두 0 이상이면
+    비음 제약이 비활성이므로 QP 없이 그대로 사용합니다.
+    """
+    n = L.shape[0]
+    q_ones = _cov_solve(S, np.ones(n))
+    if q_ones is not None and q_ones.sum() > 0:
+        weights = q_ones / q_ones.sum()
+        if weights.min() >= 0.0:
+            return weights
+
+    result = _minimize_variance(L, np.full(n, 1.0 / n), [])
+    if not result.success:
+        logger.warning(f"Min Volatility solver did not converge: {result.message}")
+    return result.x
+
+
+def _solve_efficient_return(
+    mu: np.ndarray,
+    L: np.ndarray,
+    target_return: float,
+    x0: np.ndarray
+) -> Optional[np.ndarray]:
+    """
+    목표 수익률 이상에서 분산 최소화 (long-only)
+
+    Args:
+        x0: 초기 비중 (직전 frontier 포인트로 warm-start)
+
+    Returns:
+        비중 배열, 풀이 실패 시 None
+    """
+    result = _minimize_variance(
+        L, x0, [{
+            'type': 'ineq', 'fun': _excess_return, 'jac': _excess_return_grad, 'args': (mu, target_return)
+        }]
+    )
+    # 수렴 실패 또는 목표 수익률 미달(조기 종료)인 해는 버림
+    if not result.success or mu @ result.x < target_return - RETURN_TOLERANCE:
+        return None
+    return result.x
+
+
+def _closed_form_frontier(
+    mu: np.ndarray,
+    S: np.ndarray,
+    target_returns: np.ndarray
+) -> Optional[np.ndarray]:
+    """
+    공매도 허용 frontier 비중 행렬 (해석해)
+
+    비중 합 1, 기대수익률 ρ 제약만 있는 최소분산 해는 ρ에 대해 선형입니다:
+        w(ρ) = f + ρg
+        f = Σ⁻¹(a22·1 - a12·μ) / d,  g = Σ⁻¹(a11·μ - a12·1) / d
+        a11 = 1'Σ⁻¹1,  a12 = μ'Σ⁻¹1,  a22 = μ'Σ⁻¹μ,  d = a11·a22 - a12²
+    모든 비중이 0 이상인 포인트는 long-only 문제의 최적해이기도 합니다.
+
+    Returns:
+        (n_points, n) 비중 행렬, Σ가 양의 정부호가 아니거나 μ가 모두 같으면 None
+    """
+    ones = np.ones_like(mu)
+    solved = _cov_solve(S, np.column_stack([ones, mu]))
+    if solved is None:
+        return None
+    q_ones, q_mu = solved.T
+
+    a11 = ones @ q_ones
+    a12 = mu @ q_ones
+    a22 = mu @ q_mu
+    d = a11 * a22 - a12 ** 2
+    if not np.isfinite(d) or d <= 0:
+        return None
+
+    f = (a22 * q_ones - a12 * q_mu) / d
+    g = (a11 * q_mu - a12 * q_ones) / d
+    return f[None, :] + target_returns[:, None] * g[None, :]
+
 
 class PortfolioOptimizer:
     """
     포트폴리오 최적화 클래스
 
-    PyPortfolioOpt를 활용하여 Mean-Variance Optimization 수행
+    Ledoit-Wolf 공분산과 long-only QP로 Mean-Variance Optimization 수행
 
     Attributes:
         tickers: ETF 심볼 리스트
@@ -58,8 +329,34 @@ class PortfolioOptimizer:
         self.risk_free_rate = risk_free_rate or BACKTEST_CONSTANTS['risk_free_rate']
 
         self._price_data: Optional[pd.DataFrame] = None
-        self._mu: Optional[pd.Series] = None  # 기대수익률
-        self._S: Optional[pd.DataFrame] = None  # 공분산 행렬
+        self._mu_series: Optional[pd.Series] = None  # 기대수익률
+        self._mu_array: Optional[np.ndarray] = None  # 기대수익률 배열 (tickers 순서)
+        self._cov_frame: Optional[pd.DataFrame] = None  # 공분산 행렬
+        self._S_array: Optional[np.ndarray] = None  # 공분산 행렬 배열 (tickers 순서)
+        self._L: Optional[np.ndarray] = None  # 공분산 분해 인자 (Σ = LLᵀ)
+
+    @property
+    def _mu(self) -> Optional[pd.Series]:
+        """기대수익률 (연율화)"""
+        return self._mu_series
+
+    @_mu.setter
+    def _mu(self, value: Optional[pd.Series]) -> None:
+        # 새 값이 들어오면 파생 배열 캐시 무효화
+        self._mu_series = value
+        self._mu_array = None
+
+    @property
+    def _S(self) -> Optional[pd.DataFrame]:
+        """공분산 행렬 (연율화)"""
+        return self._cov_frame
+
+    @_S.setter
+    def _S(self, value: Optional[pd.DataFrame]) -> None:
+        # 새 값이 들어오면 파생 배열/분해 인자 캐시 무효화
+        self._cov_frame = value
+        self._S_array = None
+        self._L = None
 
     def fetch_data(self) -> pd.DataFrame:
         """
@@ -82,44 +379,117 @@ class PortfolioOptimizer:
 
         self._price_data = prices
 
-        # 기대수익률과 공분산 행렬 계산
-        self._mu = expected_returns.mean_historical_return(prices)
-        self._S = risk_models.sample_cov(prices)
+        # 기대수익률과 공분산 행렬 계산 (연속 행렬 한 번으로 처리)
+        values = np.ascontiguousarray(prices.to_numpy(dtype=np.float64))
+        # 수익률은 float64로 나눈 뒤 float32로 보관 (표본 공분산 추정오차가 float32 정밀도보다 훨씬 큼)
+        returns = np.ascontiguousarray(values[1:] / values[:-1] - 1.0, dtype=np.float32)
+
+        # 기대수익률: 기간 복리 수익률 연율화 (CAGR)
+        mu = (values[-1] / values[0]) ** (TRADING_DAYS_PER_YEAR / len(returns)) - 1.0
+        # 공분산: Ledoit-Wolf 수축 추정 (float32 GEMM) 후 float64로 승격해 연율화
+        S = _ledoit_wolf_cov(returns).astype(np.float64) * TRADING_DAYS_PER_YEAR
+
+        self._mu = pd.Series(mu, index=prices.columns)
+        self._mu_array = mu
+        self._S = pd.DataFrame(S, index=prices.columns, columns=prices.columns)
+        self._S_array = S
+        self._L = _covariance_factor(S)
 
         logger.info(f"Loaded {len(prices)} days of price data")
         return prices
 
-    def optimize_max_sharpe(self) -> Dict[str, float]:
+    def _get_mu_array(self) -> np.ndarray:
+        """기대수익률 배열 반환 (최초 1회 변환 후 재사용)"""
+        if self._mu_array is None:
+            self._mu_array = np.asarray(self._mu, dtype=float)
+        return self._mu_array
+
+    def _get_cov_array(self) -> np.ndarray:
+        """공분산 행렬 배열 반환 (최초 1회 변환 후 재사용)"""
+        if self._S_array is None:
+            self._S_array = np.asarray(self._S, dtype=float)
+        return self._S_array
+
+    def _get_cov_factor(self) -> np.ndarray:
+        """공분산 분해 인자 L 반환 (최초 1회 계산 후 재사용)"""
+        if self._L is None:
+            self._L = _covariance_factor(self._get_cov_array())
+        return self._L
+
+    def _solve_weights(self, algorithm: str) -> np.ndarray:
         """
-        Max Sharpe Ratio 최적화
+        알고리즘별 최적 비중 계산 (정리된 배열, tickers 순서)
 
-        Returns:
-            최적 비중 딕셔너리 {ticker: weight}
+        Args:
+            algorithm: 'max_sharpe' 또는 'min_volatility'
         """
         if self._mu is None or self._S is None:
             self.fetch_data()
 
-        ef = EfficientFrontier(self._mu, self._S)
-        ef.max_sharpe(risk_free_rate=self.risk_free_rate)
-        weights = ef.clean_weights()
+        if algorithm == 'max_sharpe':
+            weights = _solve_max_sharpe(
+                self._get_mu_array(),
+                self._get_cov_array(),
+                self._get_cov_factor(),
+                self.risk_free_rate
+            )
+        elif algorithm == 'min_volatility':
+            weights = _solve_min_volatility(self._get_cov_array(), self._get_cov_factor())
+        else:
+            raise ValueError(f"지원하지 않는 최적화 알고리즘입니다: {algorithm}")
+
+        return _clean_weights(weights)
+
+    def _performance_from_array(self, weight_array: np.ndarray) -> Dict[str, float]:
+        """tickers 순서 비중 배열로 성과 지표 계산"""
+        expected_return = float(self._get_mu_array() @ weight_array)
+        volatility = float(np.sqrt(_portfolio_variance(weight_array, self._get_cov_factor())))
+        sharpe = (expected_return - self.risk_free_rate) / volatility
+
+        return {
+            'expected_return': expected_return,
+            'volatility': volatility,
+            'sharpe_ratio': sharpe
+        }
 
-        return dict(weights)
+    def optimize(self, algorithm: str = 'max_sharpe') -> Tuple[Dict[str, float], Dict[str, float]]:
+        """
+        최적화와 성과 지표 계산을 한 번에 수행
 
-    def optimize_min_volatility(self) -> Dict[str, float]:
+        풀이 결과 비중 배열로 지표를 바로 계산하므로
+        optimize_*() 후 get_performance_metrics()를 호출하는 것과 결과는 같고
+        딕셔너리 → 배열 재변환이 없습니다.
+
+        Args:
+            algorithm: 'max_sharpe' 또는 'min_volatility'
+
+        Returns:
+            (최적 비중 딕셔너리, 성과 지표 딕셔너리) 튜플
+
+        Raises:
+            ValueError: 지원하지 않는 알고리즘인 경우
         """
-        Min Volatility 최적화
+        weight_array = self._solve_weights(algorithm)
+        weights = dict(zip(self.tickers, weight_array.tolist()))
+        return weights, self._performance_from_array(weight_array)
+
+    def optimize_max_sharpe(self) -> Dict[str, float]:
+        """
+        Max Sharpe Ratio 최적화
 
         Returns:
             최적 비중 딕셔너리 {ticker: weight}
         """
-        if self._mu is None or self._S is None:
-            self.fetch_data()
+        return dict(zip(self.tickers, self._solve_weights('max_sharpe').tolist()))
 
-        ef = EfficientFrontier(self._mu, self._S)
-        ef.min_volatility()
-        weights = ef.clean_weights()
+    def optimize_min_volatility(self) -> Dict[str, float]:
+        """
+        Min Volatility 최적화
 
-        return dict(weights)
+        Returns:
+            최적 비중 딕셔너리 {ticker: weight}
+        """
+        return dict(zip(self.tickers, self._solve_weights('min_volatility').tolist()))
 
     def get_performance_metrics(self, weights: Dict[str, float]) -> Dict[str, float]:
         """
@@ -138,26 +508,18 @@ class PortfolioOptimizer:
         if self._mu is None or self._S is None:
             self.fetch_data()
 
-        ef = EfficientFrontier(self._mu, self._S)
-
-        # 비중 설정
-        weight_array = np.array([weights.get(t, 0) for t in self.tickers])
-        ef.set_weights({t: w for t, w in zip(self.tickers, weight_array)})
-
-        expected_return, volatility, sharpe = ef.portfolio_performance(
-            risk_free_rate=self.risk_free_rate
-        )
-
-        return {
-            'expected_return': expected_return,
-            'volatility': volatility,
-            'sharpe_ratio': sharpe
-        }
+        weight_array = np.array([weights.get(t, 0) for t in self.tickers], dtype=float)
+        return self._performance_from_array(weight_array)
 
     def get_efficient_frontier(self, n_points: int = 100) -> Tuple[np.ndarray, np.ndarray, List[Dict]]:
         """
         Efficient Frontier 곡선 데이터 생성
 
+        공매도 허용 해석해 w(ρ) = f + ρg 를 한 번에 계산해 비중이 모두 0 이상인
+        포인트는 그대로 사용합니다. long-only 제약이 활성화되는 포인트만
+        목표 수익률별 QP를 풀되, 직전 두 포인트의 비중을 외삽해 warm-start 합니다.
+        수익률/변동성은 전체 비중 행렬에 대해 한 번에 계산합니다.
+
         Args:
             n_points: 곡선 포인트 수
 
@@ -170,39 +532,67 @@ class PortfolioOptimizer:
         if self._mu is None or self._S is None:
             self.fetch_data()
 
-        volatilities = []
-        returns = []
-        weights_list = []
+        mu = self._get_mu_array()
+        L = self._get_cov_factor()
 
         # 수익률 범위 결정 (min volatility ~ max return 사이)
-        ef_min = EfficientFrontier(self._mu, self._S)
-        ef_min.min_volatility()
-        min_ret, _, _ = ef_min.portfolio_performance(risk_free_rate=self.risk_free_rate)
-
-        ef_max = EfficientFrontier(self._mu, self._S)
-        ef_max.max_sharpe(risk_free_rate=self.risk_free_rate)
-        max_ret, _, _ = ef_max.portfolio_performance(risk_free_rate=self.risk_free_rate)
-
-        # max return 포인트 추가
-        max_single_ret = self._mu.max()
-
-        target_returns = np.linspace(min_ret, max(max_ret, max_single_ret * 0.95), n_points)
-
-        for target_ret in target_returns:
-            try:
-                ef = EfficientFrontier(self._mu, self._S)
-                ef.efficient_return(target_ret)
-                weights = ef.clean_weights()
-                ret, vol, _ = ef.portfolio_performance(risk_free_rate=self.risk_free_rate)
-
-                volatilities.append(vol)
-                returns.append(ret)
-                weights_list.append(dict(weights))
-            except Exception:
-                # 도달 불가능한 수익률은 스킵
-                continue
-
-        return np.array(volatilities), np.array(returns), weights_list
+        min_vol_weights = _solve_min_volatility(self._get_cov_array(), L)
+        min_ret = float(mu @ min_vol_weights)
+
+        # long-only에서 도달 가능한 최대 수익률은 최고 수익률 단일 자산 (별도 풀이 불필요)
+        max_ret = float(mu.max())
+
+        if max_ret - min_ret <= RETURN_TOLERANCE:
+            # 최소 변동성 포트폴리오가 곧 최고 수익률 자산이면 범위 폭이 0 → 한 점만 반환
+            target_returns = np.array([min_ret])
+            analytic = min_vol_weights[np.newaxis, :]
+        else:
+            target_returns = np.linspace(min_ret, max_ret, n_points)
+            analytic = _closed_form_frontier(mu, self._get_cov_array(), target_returns)
+
+        # 결과 비중 행렬을 미리 할당하고 풀린 포인트만 앞에서부터 채움
+        W = np.empty((len(target_returns), len(mu)))
+        k = 0
+        x0 = min_vol_weights
+        prev = None
+        for i, target_ret in enumerate(target_returns):
+            if analytic is not None and analytic[i].min() >= 0.0:
+                # 해석해가 long-only를 만족하면 비음 제약이 비활성 → QP 해와 동일
+                weights = analytic[i]
+            else:
+                # 인접 포인트 간 최적해는 목표 수익률에 대해 (활성 제약이 바뀌기 전까지) 선형으로 움직이므로
+                # 직전 두 해로 외삽한 값을 초기값으로 사용 (SLSQP 반복 횟수 약 절반 이하로 감소)
+                guess = x0
+                extrapolated = prev is not None
+                if extrapolated:
+                    secant = 2.0 * x0 - prev
+                    # 외삽값이 경계(0 또는 1)를 넘으면 활성 제약이 바뀌는 구간 → 직전 해에서 시작
+                    if secant.min() < 0.0 or secant.max() > 1.0:
+                        extrapolated = False
+                    else:
+                        guess = secant / secant.sum()
+
+                weights = _solve_efficient_return(mu, L, target_ret, guess)
+                if weights is None and extrapolated:
+                    # 외삽 초기값에서 수렴 실패 → 직전 해에서 재시도
+                    weights = _solve_efficient_return(mu, L, target_ret, x0)
+                if weights is None:
+                    # 도달 불가능한 수익률은 스킵
+                    continue
+
+            W[k] = weights
+            k += 1
+            prev, x0 = x0, weights
+
+        if k == 0:
+            return np.array([]), np.array([]), []
+
+        W = W[:k]
+        returns = W @ mu
+        volatilities = np.linalg.norm(W @ L, axis=1)
+        weights_list = [dict(zip(self.tickers, row)) for row in _clean_weights(W).tolist()]
+
+        return volatilities, returns, weights_list
 
     def get_individual_assets(self) -> pd.DataFrame:
         """
@@ -214,13 +604,8 @@ class PortfolioOptimizer:
         if self._mu is None or self._S is None:
             self.fetch_data()
 
-        data = []
-        for ticker in self.tickers:
-            vol = np.sqrt(self._S.loc[ticker, ticker])
-            data.append({
-                'ticker': ticker,
-                'expected_return': self._mu[ticker],
-                'volatility': vol
-            })
-
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            'ticker': list(self.tickers),
+            'expected_return': self._get_mu_array(),
+            'volatility': np.sqrt(np.diag(self._get_cov_array()))
+        })
@@ -8,29 +8,37 @@ import pytest
 from streamlit.testing.v1 import AppTest
 
 
+@pytest.fixture(scope="module")
+def loaded_app():
+    """읽기 전용 테스트가 공유하는 AppTest (모듈당 1회 실행)
+
+    위젯 값을 바꾸는 테스트는 상태가 섞이지 않도록 각자 새로 생성합니다.
+    """
+    at = AppTest.from_file("app.py")
+    at.run(timeout=30)
+    return at
+
+
 class TestMainAppLoads:
     """메인 앱 로드 테스트"""
 
-    def test_app_loads_without_error(self):
+    def test_app_loads_without_error(self, loaded_app):
         """앱이 에러 없이 로드되는지 확인"""
-        at = AppTest.from_file("app.py")
-        at.run(timeout=30)
+        at = loaded_app
         assert not at.exception, f"App raised exception: {at.exception}"
 
-    def test_main_title_displayed(self):
+    def test_main_title_displayed(self, loaded_app):
         """메인 타이틀이 표시되는지 확인"""
-        at = AppTest.from_file("app.py")
-        at.run(timeout=30)
+        at = loaded_app
 
         # 타이틀 확인
         titles = [t.value for t in at.title]
         assert any("은퇴의 꿈" in title for title in titles), \
             f"Expected '은퇴의 꿈' in titles, got: {titles}"
 
-    def test_sidebar_page_selector_exists(self):
+    def test_sidebar_page_selector_exists(self, loaded_app):
         """사이드바 페이지 선택 라디오 버튼 존재 확인"""
-        at = AppTest.from_file("app.py")
-        at.run(timeout=30)
+        at = loaded_app
 
         # 사이드바에 radio 버튼이 있는지 확인
         assert len(at.sidebar.radio) > 0, "Expected radio button in sidebar"
@@ -39,10 +47,9 @@ class TestMainAppLoads:
 class TestAllocationBacktestPage:
     """자산 배분 백테스트 페이지 테스트"""
 
-    def test_default_page_is_backtest(self):
+    def test_default_page_is_backtest(self, loaded_app):
         """기본 페이지가 자산 배분 백테스트인지 확인"""
-        at = AppTest.from_file("app.py")
-        at.run(timeout=30)
+        at = loaded_app
 
         # 기본 선택된 라디오 값 확인
         radio = at.sidebar.radio[0]
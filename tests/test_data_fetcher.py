@@ -0,0 +1,55 @@
+"""
+데이터 캐싱 레이어 테스트
+"""
+import pytest
+import pandas as pd
+import numpy as np
+from unittest.mock import patch
+from src.data.data_fetcher import fetch_adjusted_prices
+
+
+def make_download_df(tickers, n_days=5, nan_tickers=()):
+    """yf.download(group_by='column') 형식의 MultiIndex DataFrame 생성"""
+    dates = pd.bdate_range("2024-01-02", periods=n_days, tz="America/New_York")
+    columns = pd.MultiIndex.from_product([['Close', 'Volume'], sorted(tickers)], names=['Price', 'Ticker'])
+    data = pd.DataFrame(
+        np.arange(1, len(columns) * n_days + 1, dtype=float).reshape(n_days, len(columns)),
+        index=dates,
+        columns=columns
+    )
+    for ticker in nan_tickers:
+        data[('Close', ticker)] = np.nan
+    return data
+
+
+class TestFetchAdjustedPrices:
+    """fetch_adjusted_prices 함수 테스트 (mocked)"""
+
+    @patch('src.data.data_fetcher.yf.download')
+    def test_single_batched_download(self, mock_download):
+        """전체 티커를 한 번에 요청하고 호출 순서대로 컬럼 반환"""
+        mock_download.return_value = make_download_df(["SPY", "BND", "QQQ"])
+
+        result = fetch_adjusted_prices(("SPY", "BND", "QQQ"), "2024-01-01", "2024-01-10", min_days=5)
+
+        assert mock_download.call_count == 1
+        assert mock_download.call_args.args[0] == ["SPY", "BND", "QQQ"]
+        assert list(result.columns) == ["SPY", "BND", "QQQ"]
+        assert result.index.tz is None
+        assert len(result) == 5
+
+    @patch('src.data.data_fetcher.yf.download')
+    def test_failed_ticker_raises_error(self, mock_download):
+        """일부 티커가 전부 NaN → ValueError"""
+        mock_download.return_value = make_download_df(["SPY", "XXXX"], nan_tickers=("XXXX",))
+
+        with pytest.raises(ValueError, match="XXXX"):
+            fetch_adjusted_prices(("SPY", "XXXX"), "2024-01-01", "2024-01-11", min_days=5)
+
+    @patch('src.data.data_fetcher.yf.download')
+    def test_all_missing_tickers_reported(self, mock_download):
+        """응답에 컬럼이 없는 티커와 NaN 티커를 모두 에러 메시지에 포함"""
+        mock_download.return_value = make_download_df(["SPY", "XXXX"], nan_tickers=("XXXX",))
+
+        with pytest.raises(ValueError, match="'XXXX', 'YYYY'"):
+            fetch_adjusted_prices(("SPY", "XXXX", "YYYY"), "2024-01-01", "2024-01-12", min_days=5)
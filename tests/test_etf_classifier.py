@@ -4,7 +4,7 @@ ETF 분류 모듈 테스트
 import pytest
 from src.data.etf_classifier import (
     Market, ETFInfo, classify_etf, normalize_ticker,
-    is_korean_ticker, classify_portfolio, has_mixed_currencies,
+    is_korean_ticker, is_valid_ticker, classify_portfolio, has_mixed_currencies,
     needs_currency_conversion, get_tax_label, KOREAN_ETF_REGISTRY,
 )
 
@@ -69,6 +69,34 @@ class TestIsKoreanTicker:
         assert is_korean_ticker("") is False
 
 
+class TestIsValidTicker:
+    """is_valid_ticker 함수 테스트"""
+
+    def test_us_tickers(self):
+        for ticker in ("SPY", "QQQ", "VXUS", "BRK-B", "BRK.B"):
+            assert is_valid_ticker(ticker) is True
+
+    def test_korean_tickers(self):
+        assert is_valid_ticker("069500.KS") is True
+        assert is_valid_ticker("035720.KQ") is True
+
+    def test_normalized_six_digit_input(self):
+        assert is_valid_ticker(normalize_ticker("069500")) is True
+
+    def test_other_yfinance_symbols(self):
+        """암호화폐/지수/선물/해외 거래소 심볼도 허용"""
+        for ticker in ("BTC-USD", "^GSPC", "GC=F", "7203.T", "0700.HK"):
+            assert is_valid_ticker(ticker) is True
+
+    def test_normalized_other_symbols(self):
+        for raw in ("btc-usd", " ^gspc ", "gc=f", "7203.t"):
+            assert is_valid_ticker(normalize_ticker(raw)) is True
+
+    def test_malformed_tickers(self):
+        for ticker in ("", "   ", "S PY", "SPY!", "SPY/X", "-SPY", "spy", "A" * 16):
+            assert is_valid_ticker(ticker) is False
+
+
 class TestClassifyETF:
     """classify_etf 함수 테스트"""
 
@@ -100,6 +100,14 @@ class TestGetPrice:
         bt = create_backtester_with_data(price_data={"ETF_A": PRICE_DATA_A})
         assert bt._get_price("UNKNOWN", TRADE_DATES[0]) is None
 
+    def test_replaced_price_data_not_stale(self):
+        """가격 데이터 교체 시 새 데이터로 조회"""
+        bt = create_backtester_with_data(price_data={"ETF_A": PRICE_DATA_A})
+        assert bt._get_price("ETF_A", TRADE_DATES[0]) == pytest.approx(100.0)
+
+        bt._price_data["ETF_A"] = make_price_df(TRADE_DATES, [200.0] * 20)
+        assert bt._get_price("ETF_A", TRADE_DATES[0]) == pytest.approx(200.0)
+
 
 class TestGetPortfolioValue:
     """_get_portfolio_value 테스트"""
@@ -530,6 +538,50 @@ class TestDataFrameOutputs:
         assert expected_cols.issubset(set(df.columns))
         assert len(df) >= 1
 
+    def test_history_df_cached_on_result(self):
+        """히스토리 DataFrame은 결과 객체에 캐시되고 사본이 반환됨"""
+        bt = create_backtester_with_data(allocation={"ETF_A": 0.6, "ETF_B": 0.4})
+
+        snapshots = [
+            PortfolioSnapshot(
+                date=pd.Timestamp("2024-01-01"),
+                holdings={"ETF_A": 600, "ETF_B": 800},
+                prices={"ETF_A": 100.0, "ETF_B": 50.0},
+                cash=1000,
+                total_value=101000,
+                cumulative_withdrawal=0,
+                cumulative_dividend=0,
+                cumulative_tax=0,
+            ),
+        ]
+        result = BacktestResult(
+            portfolio_history=snapshots,
+            rebalance_events=[],
+            withdrawal_events=[],
+            dividend_events=[],
+            tax_events=[],
+            initial_value=100000,
+            final_value=101000,
+            total_return=1.0,
+            cagr=1.0,
+            volatility=10.0,
+            sharpe_ratio=0.5,
+            max_drawdown=-5.0,
+            total_withdrawal=0,
+            total_dividend_gross=0,
+            total_dividend_net=0,
+            total_tax=0,
+            total_transaction_cost=0,
+        )
+
+        with patch.object(bt, "_build_history_df", wraps=bt._build_history_df) as build:
+            first = bt.get_portfolio_history_df(result)
+            first["total_value"] = 0
+            second = bt.get_portfolio_history_df(result)
+
+        assert build.call_count == 1
+        assert second["total_value"].iloc[0] == 101000
+
 
 class TestRunWithMockedData:
     """데이터 캐싱 레이어 모킹을 통한 run() 통합 테스트"""
@@ -627,3 +679,33 @@ class TestRunWithMockedData:
         assert result.total_withdrawal > 0
         # 인출로 인해 최종 가치가 초기보다 감소
         assert result.final_value < result.initial_value
+
+    @patch("src.backtest.portfolio_backtest.fetch_dividend_data")
+    @patch("src.backtest.portfolio_backtest.fetch_price_data")
+    def test_run_with_preloaded_data_skips_fetch(self, mock_fetch_price, mock_fetch_div):
+        """미리 로드된 종목은 재조회하지 않음"""
+        dates = pd.bdate_range("2023-01-02", "2024-06-30")
+        price_a = make_price_df(dates, [100.0 + i * 0.1 for i in range(len(dates))])
+        price_b = make_price_df(dates, [50.0] * len(dates))
+
+        mock_fetch_price.return_value = price_b
+        mock_fetch_div.return_value = make_empty_dividend_series()
+
+        bt = PortfolioBacktester(
+            initial_capital=100000,
+            allocation={"ETF_A": 0.6, "ETF_B": 0.4},
+            withdrawal_rate=0.0,
+            transaction_cost_rate=0.0,
+            price_data={"ETF_A": price_a},
+            dividend_data={"ETF_A": make_empty_dividend_series()},
+        )
+
+        result = bt.run(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2024, 7, 1),
+        )
+
+        fetched = [c.args[0] for c in mock_fetch_price.call_args_list]
+        assert fetched == ["ETF_B"]
+        assert [c.args[0] for c in mock_fetch_div.call_args_list] == ["ETF_B"]
+        assert result.final_value > result.initial_value
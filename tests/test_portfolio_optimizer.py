@@ -125,6 +125,53 @@ class TestOptimizeMaxSharpe:
 
         assert sum(weights.values()) == pytest.approx(1.0, abs=0.01)
 
+    def test_sharpe_not_below_other_portfolios(self):
+        """Max Sharpe 비중의 샤프비율이 동일 비중/Min Volatility 이상"""
+        tickers = ["ETF_A", "ETF_B", "ETF_C", "ETF_D"]
+        opt = create_optimizer_with_mock_data(tickers, n_days=600, seed=7)
+
+        best = opt.get_performance_metrics(opt.optimize_max_sharpe())["sharpe_ratio"]
+        equal = opt.get_performance_metrics({t: 0.25 for t in tickers})["sharpe_ratio"]
+        min_vol = opt.get_performance_metrics(opt.optimize_min_volatility())["sharpe_ratio"]
+
+        assert best >= equal - 1e-6
+        assert best >= min_vol - 1e-6
+
+    def test_no_asset_above_risk_free_raises_error(self):
+        """모든 자산의 기대수익률이 무위험수익률 이하이면 ValueError"""
+        opt = create_optimizer_with_mock_data(["ETF_A", "ETF_B"])
+        opt.risk_free_rate = float(np.max(opt._mu)) + 0.01
+
+        with pytest.raises(ValueError, match="무위험수익률"):
+            opt.optimize_max_sharpe()
+
+    def test_matches_tangency_portfolio_when_long_only_inactive(self):
+        """접점 포트폴리오가 모두 양수면 Σ⁻¹(μ - rf) 정규화 비중과 일치"""
+        opt = create_optimizer_with_mock_data(["ETF_A", "ETF_B", "ETF_C"], seed=1)
+        z = np.linalg.solve(opt._S.to_numpy(), opt._mu.to_numpy() - opt.risk_free_rate)
+        expected = z / z.sum()
+        assert (expected > 0).all()
+
+        weights = opt.optimize_max_sharpe()
+
+        assert [weights[t] for t in opt.tickers] == pytest.approx(expected, abs=1e-4)
+
+
+class TestCachedArrays:
+    """기대수익률/공분산 파생 캐시 무효화 테스트"""
+
+    def test_reassigned_inputs_not_stale(self):
+        """_mu/_S를 다시 주입하면 이후 계산에 새 값이 반영됨"""
+        opt = create_optimizer_with_mock_data(["ETF_A", "ETF_B", "ETF_C"], seed=1)
+        opt.optimize_min_volatility()
+
+        other = create_optimizer_with_mock_data(["ETF_A", "ETF_B", "ETF_C"], seed=2)
+        opt._mu = other._mu
+        opt._S = other._S
+
+        assert opt.optimize("min_volatility") == other.optimize("min_volatility")
+        assert opt.get_individual_assets().equals(other.get_individual_assets())
+
 
 # --- Min Volatility 최적화 테스트 ---
 
@@ -154,6 +201,17 @@ class TestOptimizeMinVolatility:
 
         assert set(weights.keys()) == set(tickers)
 
+    def test_matches_global_min_variance_when_long_only_inactive(self):
+        """전역 최소분산 해가 모두 양수면 Σ⁻¹1 / 1'Σ⁻¹1 과 일치"""
+        opt = create_optimizer_with_mock_data(["ETF_A", "ETF_B", "ETF_C"])
+        q = np.linalg.solve(opt._S.to_numpy(), np.ones(3))
+        expected = q / q.sum()
+        assert (expected > 0).all()
+
+        weights = opt.optimize_min_volatility()
+
+        assert [weights[t] for t in opt.tickers] == pytest.approx(expected, abs=1e-4)
+
 
 # --- 성과 지표 테스트 ---
 
@@ -178,6 +236,29 @@ class TestGetPerformanceMetrics:
 
         assert metrics["volatility"] > 0
 
+    def test_volatility_matches_covariance(self):
+        """변동성이 √(w'Σw)와 일치"""
+        tickers = ["ETF_A", "ETF_B", "ETF_C"]
+        opt = create_optimizer_with_mock_data(tickers)
+        weights = {"ETF_A": 0.2, "ETF_B": 0.5, "ETF_C": 0.3}
+        metrics = opt.get_performance_metrics(weights)
+
+        w = np.array([0.2, 0.5, 0.3])
+        expected_vol = np.sqrt(w @ opt._S.to_numpy() @ w)
+        assert metrics["volatility"] == pytest.approx(expected_vol, rel=1e-8)
+        assert metrics["expected_return"] == pytest.approx(w @ opt._mu.to_numpy(), rel=1e-12)
+
+    def test_indefinite_covariance_falls_back(self):
+        """양의 정부호가 아닌 공분산도 고유값 분해로 대체하여 계산"""
+        tickers = ["ETF_A", "ETF_B"]
+        opt = create_optimizer_with_mock_data(tickers)
+        # 고유값 0.09, -0.01 → 음수 고유값 절단
+        opt._S = pd.DataFrame([[0.04, 0.05], [0.05, 0.04]], index=tickers, columns=tickers)
+
+        metrics = opt.get_performance_metrics({"ETF_A": 0.5, "ETF_B": 0.5})
+
+        assert metrics["volatility"] == pytest.approx(np.sqrt(0.045), rel=1e-8)
+
     def test_equal_weight_metrics(self):
         """동일 비중 포트폴리오 지표"""
         tickers = ["ETF_A", "ETF_B"]
@@ -190,6 +271,30 @@ class TestGetPerformanceMetrics:
         assert isinstance(metrics["sharpe_ratio"], float)
 
 
+class TestOptimize:
+    """최적화 + 성과 지표 일괄 계산 테스트"""
+
+    @pytest.mark.parametrize("algorithm", ["max_sharpe", "min_volatility"])
+    def test_matches_separate_calls(self, algorithm):
+        """optimize_*() + get_performance_metrics()와 동일한 결과"""
+        opt = create_optimizer_with_mock_data(["ETF_A", "ETF_B", "ETF_C"])
+        weights, metrics = opt.optimize(algorithm)
+
+        if algorithm == "max_sharpe":
+            expected_weights = opt.optimize_max_sharpe()
+        else:
+            expected_weights = opt.optimize_min_volatility()
+
+        assert weights == expected_weights
+        assert metrics == pytest.approx(opt.get_performance_metrics(expected_weights), rel=1e-12)
+
+    def test_unknown_algorithm_raises_error(self):
+        """지원하지 않는 알고리즘 → ValueError"""
+        opt = create_optimizer_with_mock_data(["ETF_A", "ETF_B"])
+        with pytest.raises(ValueError, match="지원하지 않는"):
+            opt.optimize("max_return")
+
+
 # --- Efficient Frontier 테스트 ---
 
 class TestGetEfficientFrontier:
@@ -204,6 +309,19 @@ class TestGetEfficientFrontier:
         assert len(vols) == len(weights_list)
         assert len(vols) > 0
 
+    def test_zero_width_return_range_returns_single_point(self):
+        """최소 변동성 포트폴리오가 최고 수익률 자산이면 한 점만 반환"""
+        opt = PortfolioOptimizer(tickers=["ETF_A", "ETF_B"], period_years=5)
+        opt._mu = pd.Series([0.10, 0.05], index=opt.tickers)
+        opt._S = pd.DataFrame(
+            [[0.01, 0.018], [0.018, 0.04]], index=opt.tickers, columns=opt.tickers
+        )
+        vols, rets, weights_list = opt.get_efficient_frontier(n_points=50)
+
+        assert len(vols) == 1
+        assert rets[0] == pytest.approx(0.10)
+        assert weights_list[0]["ETF_A"] == pytest.approx(1.0)
+
     def test_volatilities_are_positive(self):
         """변동성 배열의 모든 값이 양수"""
         opt = create_optimizer_with_mock_data(["ETF_A", "ETF_B", "ETF_C"])
@@ -227,6 +345,34 @@ class TestGetEfficientFrontier:
         for weights in weights_list:
             assert sum(weights.values()) == pytest.approx(1.0, abs=0.02)
 
+    def test_frontier_is_monotonic_and_long_only(self):
+        """해석해/QP 혼합 결과도 수익률·변동성 단조 증가, 비중 0 이상"""
+        opt = create_optimizer_with_mock_data(["ETF_A", "ETF_B", "ETF_C", "ETF_D"])
+        vols, rets, weights_list = opt.get_efficient_frontier(n_points=30)
+
+        assert (np.diff(rets) > 0).all()
+        assert (np.diff(vols) > -1e-9).all()
+        for weights in weights_list:
+            assert min(weights.values()) >= 0.0
+
+    @pytest.mark.parametrize("seed", [62, 79])
+    def test_warm_start_not_worse_than_cold_start(self, seed):
+        """warm-start 포인트의 변동성이 균등 비중에서 새로 푼 QP보다 크지 않음"""
+        from src.optimizer.portfolio_optimizer import _solve_efficient_return
+
+        tickers = [f"ETF_{c}" for c in "ABCDE"]
+        opt = create_optimizer_with_mock_data(tickers, n_days=500, seed=seed)
+        vols, rets, _ = opt.get_efficient_frontier(n_points=50)
+
+        mu = opt._mu.to_numpy()
+        S = opt._S.to_numpy()
+        L = np.linalg.cholesky(S)
+        x0 = np.full(len(tickers), 1.0 / len(tickers))
+        for vol, ret in zip(vols, rets):
+            cold = _solve_efficient_return(mu, L, ret - 1e-9, x0)
+            if cold is not None:
+                assert vol <= np.sqrt(cold @ S @ cold) + 1e-6
+
 
 # --- 개별 자산 정보 테스트 ---
 
@@ -290,3 +436,23 @@ class TestFetchDataMocked:
         assert opt._S is not None
         assert len(prices) > 0
         mock_fetch.assert_called_once()
+
+    @patch("src.optimizer.portfolio_optimizer.fetch_adjusted_prices")
+    def test_fetch_data_shrinks_covariance(self, mock_fetch):
+        """공분산이 Ledoit-Wolf 수축되어 대칭이며 표본 공분산보다 상관이 약함"""
+        tickers = ["ETF_A", "ETF_B", "ETF_C"]
+        prices_df = generate_realistic_prices(tickers, n_days=300)
+        mock_fetch.return_value = prices_df
+
+        opt = PortfolioOptimizer(tickers=tickers, period_years=2)
+        opt.fetch_data()
+
+        from pypfopt import risk_models
+        sample = risk_models.sample_cov(prices_df).to_numpy()
+        shrunk = opt._S.to_numpy()
+
+        assert list(opt._S.index) == tickers
+        np.testing.assert_allclose(shrunk, shrunk.T)
+        assert np.all(np.linalg.eigvalsh(shrunk) > 0)
+        off_diag = ~np.eye(len(tickers), dtype=bool)
+        assert np.all(np.abs(shrunk[off_diag]) <= np.abs(sample[off_diag]))